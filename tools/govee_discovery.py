@@ -9,33 +9,359 @@ Usage:
 
 Requirements:
     pip install aiohttp
+    pip install aiodns  (optional, faster DNS resolution)
+    pip install orjson  (optional, faster JSON parsing/encoding)
+    pip install uvloop  (optional, faster event loop; not on Windows)
 
 Author: Generated for Govee Integration Enhancement
 Date: October 2025
 """
 
 import asyncio
+import hashlib
 import json
+import os
+import random
 import ssl
+import sys
+import time
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
 
 try:
     import aiohttp
+    from yarl import URL
 except ImportError:
     print("ERROR: aiohttp is not installed.")
     print("Please install it using: pip install aiohttp")
     exit(1)
 
+try:
+    import aiodns  # noqa: F401  (enables aiohttp.AsyncResolver)
+    HAS_AIODNS = sys.platform != "win32"
+except ImportError:
+    HAS_AIODNS = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode to indented UTF-8 JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _json_serialize(obj: Any) -> str:
+    """Compact JSON serializer for aiohttp request bodies (must return str)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+# Connector shared by all GoveeAPIDiscovery instances on the same event loop so
+# DNS results and TLS keep-alive connections survive across discovery runs.
+_SHARED_CONNECTOR: Optional[aiohttp.TCPConnector] = None
+_SHARED_CONNECTOR_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_shared_connector() -> aiohttp.TCPConnector:
+    """Return the shared connector, creating it lazily for the running loop."""
+    global _SHARED_CONNECTOR, _SHARED_CONNECTOR_LOOP
+    
+    loop = asyncio.get_running_loop()
+    if _SHARED_CONNECTOR is None or _SHARED_CONNECTOR.closed or _SHARED_CONNECTOR_LOOP is not loop:
+        ssl_context = ssl.create_default_context()
+        # Resolve via c-ares when available instead of the threaded getaddrinfo
+        # executor; all requests go to a single host so cap per-host sockets.
+        _SHARED_CONNECTOR = aiohttp.TCPConnector(
+            ssl=ssl_context,
+            ttl_dns_cache=300,
+            use_dns_cache=True,
+            resolver=aiohttp.AsyncResolver() if HAS_AIODNS else None,
+            limit=100,
+            limit_per_host=64,
+        )
+        _SHARED_CONNECTOR_LOOP = loop
+    return _SHARED_CONNECTOR
+
+
+async def close_shared_connector() -> None:
+    """Close the shared connector; call once when no more discovery runs follow."""
+    global _SHARED_CONNECTOR, _SHARED_CONNECTOR_LOOP
+    
+    if _SHARED_CONNECTOR is not None:
+        await _SHARED_CONNECTOR.close()
+        _SHARED_CONNECTOR = None
+        _SHARED_CONNECTOR_LOOP = None
+
+
+class AsyncRateLimiter:
+    """Token-bucket rate limiter for asyncio (max_rate requests per time_period seconds)."""
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = max_rate
+        self._last_refill: Optional[float] = None
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        if self._last_refill is not None:
+            elapsed = now - self._last_refill
+            self._tokens = min(self.max_rate, self._tokens + elapsed * self.max_rate / self.time_period)
+        self._last_refill = now
+
+    async def acquire(self) -> None:
+        """Wait until a request token is available and consume it."""
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            if self._paused_until > loop.time():
+                await asyncio.sleep(self._paused_until - loop.time())
+            self._refill(loop.time())
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) * self.time_period / self.max_rate)
+                self._refill(loop.time())
+            self._tokens -= 1
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all further requests for the given number of seconds."""
+        self._paused_until = max(self._paused_until, asyncio.get_running_loop().time() + seconds)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+
+class AIMDConcurrencyLimiter:
+    """Adaptive concurrency limit using additive-increase / multiplicative-decrease.
+
+    The limit grows by ``increase`` after every ``window`` successful requests and
+    is multiplied by ``decrease`` whenever the API throttles or fails transiently.
+    """
+
+    def __init__(self, initial: int = 8, minimum: int = 1, maximum: int = 32,
+                 increase: int = 1, decrease: float = 0.5, window: int = 10):
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.window = window
+        self._in_flight = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+
+    def record_success(self) -> None:
+        self._successes += 1
+        if self._successes >= self.window:
+            self._successes = 0
+            self.limit = min(self.maximum, self.limit + self.increase)
+
+    def record_throttle(self) -> None:
+        self._successes = 0
+        self.limit = max(self.minimum, int(self.limit * self.decrease))
+
+    async def __aenter__(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+
+# ---------------------------------------------------------------------------
+# Capability analysis handlers, dispatched by (type, instance) or type
+# ---------------------------------------------------------------------------
+
+# Interned so lookups with interned API strings short-circuit on identity
+CAP_ON_OFF = sys.intern("devices.capabilities.on_off")
+CAP_RANGE = sys.intern("devices.capabilities.range")
+CAP_COLOR_SETTING = sys.intern("devices.capabilities.color_setting")
+CAP_TEMPERATURE_SETTING = sys.intern("devices.capabilities.temperature_setting")
+CAP_WORK_MODE = sys.intern("devices.capabilities.work_mode")
+CAP_DYNAMIC_SCENE = sys.intern("devices.capabilities.dynamic_scene")
+CAP_MUSIC_SETTING = sys.intern("devices.capabilities.music_setting")
+CAP_TIMER = sys.intern("devices.capabilities.timer")
+
+
+@dataclass(slots=True)
+class RangeControl:
+    """A ranged control (brightness, color temperature, temperature, ...)."""
+    type: str
+    range: Dict[str, Any]
+    unit: str
+
+
+@dataclass(slots=True)
+class CapabilitySummary:
+    """Per-device capability summary produced by analyze_device."""
+    power_control: bool = False
+    brightness_control: bool = False
+    color_control: bool = False
+    color_temperature: bool = False
+    temperature_setting: bool = False
+    work_modes: List[Dict[str, Any]] = field(default_factory=list)
+    dynamic_scenes: List[Dict[str, Any]] = field(default_factory=list)
+    music_setting: bool = False
+    timer_support: bool = False
+    range_controls: List[RangeControl] = field(default_factory=list)
+    custom_capabilities: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def _handle_on_off(summary: CapabilitySummary, cap: Dict[str, Any]) -> None:
+    summary.power_control = True
+
+
+def _handle_brightness(summary: CapabilitySummary, cap: Dict[str, Any]) -> None:
+    cap_params = cap.get("parameters", {})
+    summary.brightness_control = True
+    summary.range_controls.append(
+        RangeControl("brightness", cap_params.get("range", {}), cap_params.get("unit", ""))
+    )
+
+
+def _handle_color_rgb(summary: CapabilitySummary, cap: Dict[str, Any]) -> None:
+    summary.color_control = True
+
+
+def _handle_color_temperature(summary: CapabilitySummary, cap: Dict[str, Any]) -> None:
+    summary.color_temperature = True
+    summary.range_controls.append(
+        RangeControl("color_temperature", cap.get("parameters", {}).get("range", {}), "Kelvin")
+    )
+
+
+def _handle_temperature_setting(summary: CapabilitySummary, cap: Dict[str, Any]) -> None:
+    cap_params = cap.get("parameters", {})
+    summary.temperature_setting = True
+    for param_field in cap_params.get("fields", ()):
+        if param_field.get("fieldName") == "temperature":
+            summary.range_controls.append(
+                RangeControl("temperature", param_field.get("range", {}), "Celsius")
+            )
+
+
+def _handle_work_mode(summary: CapabilitySummary, cap: Dict[str, Any]) -> None:
+    cap_params = cap.get("parameters", {})
+    for param_field in cap_params.get("fields", ()):
+        if param_field.get("fieldName") == "workMode" and "options" in param_field:
+            for option in param_field["options"]:
+                summary.work_modes.append({
+                    "instance": cap.get("instance", ""),
+                    "name": option.get("name"),
+                    "value": option.get("value")
+                })
+
+
+def _handle_dynamic_scene(summary: CapabilitySummary, cap: Dict[str, Any]) -> None:
+    cap_params = cap.get("parameters", {})
+    for option in cap_params.get("options", ()):
+        summary.dynamic_scenes.append({
+            "instance": cap.get("instance", ""),
+            "name": option.get("name"),
+            "value": option.get("value")
+        })
+
+
+def _handle_music_setting(summary: CapabilitySummary, cap: Dict[str, Any]) -> None:
+    summary.music_setting = True
+
+
+def _handle_timer(summary: CapabilitySummary, cap: Dict[str, Any]) -> None:
+    summary.timer_support = True
+
+
+def _handle_range(summary: CapabilitySummary, cap: Dict[str, Any]) -> None:
+    cap_params = cap.get("parameters", {})
+    summary.range_controls.append(
+        RangeControl(cap.get("instance", ""), cap_params.get("range", {}), cap_params.get("unit", ""))
+    )
+
+
+def _handle_custom(summary: CapabilitySummary, cap: Dict[str, Any]) -> None:
+    summary.custom_capabilities.append({
+        "type": cap.get("type", ""),
+        "instance": cap.get("instance", ""),
+        "parameters": cap.get("parameters", {})
+    })
+
+
+# (type, instance) keys take precedence over plain type keys
+_CAPABILITY_HANDLERS: Dict[Any, Callable[[CapabilitySummary, Dict[str, Any]], None]] = {
+    CAP_ON_OFF: _handle_on_off,
+    (CAP_RANGE, "brightness"): _handle_brightness,
+    (CAP_COLOR_SETTING, "colorRgb"): _handle_color_rgb,
+    (CAP_COLOR_SETTING, "colorTemperatureK"): _handle_color_temperature,
+    CAP_TEMPERATURE_SETTING: _handle_temperature_setting,
+    CAP_WORK_MODE: _handle_work_mode,
+    CAP_DYNAMIC_SCENE: _handle_dynamic_scene,
+    CAP_MUSIC_SETTING: _handle_music_setting,
+    CAP_TIMER: _handle_timer,
+    CAP_RANGE: _handle_range,
+}
+
+
+# Device types whose state query is known to fail (same markers print_summary
+# reports as special types); extend as more unsupported types are observed.
+STATE_UNSUPPORTED_TYPE_MARKERS = ("sync", "hdmi")
+
+
+def supports_state_query(device_data: Dict[str, Any]) -> bool:
+    """Whether querying this device's state is worth an API request."""
+    if not device_data.get("capabilities"):
+        return False
+    api_type = device_data.get("type", "").lower()
+    return not any(marker in api_type for marker in STATE_UNSUPPORTED_TYPE_MARKERS)
+
 
 class GoveeAPIDiscovery:
     """Govee API discovery tool to extract device capabilities."""
 
     BASE_URL = "https://openapi.api.govee.com"
+    # Govee allows ~100 requests/minute; stay below it to absorb clock skew
+    RATE_LIMIT_PER_MINUTE = 90
+    MAX_RETRIES = 4
+    RETRY_BASE_DELAY = 1.0
+    RETRY_MAX_DELAY = 60.0
+    RETRY_STATUSES = frozenset({429, 502, 503, 504})
+    DEVICES_CACHE_PATH = Path.home() / ".cache" / "govee_discovery.json"
+    DEVICES_CACHE_TTL = 600
     
     def __init__(self, api_key: str):
         self.api_key = api_key.strip()
         self.session: Optional[aiohttp.ClientSession] = None
+        # Bounds in-flight requests so concurrent state queries don't flood the API,
+        # adapting the bound to how the API responds
+        self._concurrency = AIMDConcurrencyLimiter()
+        # Capability schema is identical for every device of a SKU, so analyze once per SKU
+        self._analysis_cache: Dict[str, Dict[str, Any]] = {}
+        self._etags: Dict[str, str] = {}
+        # Parsed absolute URL per endpoint path, built once and reused by every request
+        self._urls: Dict[str, URL] = {}
+        # Identifies the account in the on-disk cache without storing the key
+        self._cache_key = hashlib.sha256(self.api_key.encode("utf-8")).hexdigest()[:16]
+        self._rate_limiter = AsyncRateLimiter(self.RATE_LIMIT_PER_MINUTE, 60)
         self._headers = {
             "Content-Type": "application/json",
             "Govee-API-Key": self.api_key
@@ -49,57 +375,110 @@ class GoveeAPIDiscovery:
         await self.disconnect()
 
     async def connect(self) -> None:
-        """Initialize aiohttp session with SSL context."""
+        """Initialize aiohttp session on top of the shared keep-alive connector."""
         if self.session is None:
-            ssl_context = ssl.create_default_context()
-            connector = aiohttp.TCPConnector(
-                ssl=ssl_context,
-                ttl_dns_cache=300,
-                use_dns_cache=True,
-            )
-            
             timeout = aiohttp.ClientTimeout(total=30, connect=10)
             self.session = aiohttp.ClientSession(
                 headers=self._headers,
                 timeout=timeout,
-                connector=connector
+                connector=_get_shared_connector(),
+                connector_owner=False,
+                json_serialize=_json_serialize
             )
 
     async def disconnect(self) -> None:
-        """Close aiohttp session."""
+        """Close aiohttp session (the shared connector stays open for reuse)."""
         if self.session:
             await self.session.close()
             self.session = None
 
-    async def _make_request(self, method: str, endpoint: str) -> Dict[str, Any]:
-        """Make HTTP request to Govee API."""
+    async def _make_request(self, method: str, endpoint: str,
+                            headers: Optional[Dict[str, str]] = None,
+                            params: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+        """Make HTTP request to Govee API, retrying throttled/transient failures.
+
+        Returns None on HTTP 304 (only possible for conditional requests). The
+        response ETag, if any, is remembered per endpoint in ``self._etags``.
+        """
         if not self.session:
             await self.connect()
 
-        url = f"{self.BASE_URL}{endpoint}"
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = URL(self.BASE_URL + endpoint)
         
         try:
-            async with self.session.request(method, url) as response:
-                response_data = await response.json()
+            for attempt in range(self.MAX_RETRIES):
+                async with self._concurrency, self._rate_limiter:
+                    async with self.session.request(method, url, headers=headers, params=params) as response:
+                        self._update_rate_limit(response.headers)
+                        if "ETag" in response.headers:
+                            self._etags[endpoint] = response.headers["ETag"]
+                        if response.status == 304:
+                            return None
+                        
+                        if response.status in self.RETRY_STATUSES:
+                            self._concurrency.record_throttle()
+                        elif response.status == 200:
+                            self._concurrency.record_success()
+                        
+                        if response.status in self.RETRY_STATUSES and attempt < self.MAX_RETRIES - 1:
+                            delay = self._retry_delay(response, attempt)
+                        else:
+                            response_data = _json_loads(await response.read())
+                            
+                            if response.status == 200:
+                                if response_data.get("code") == 200:
+                                    return response_data
+                                else:
+                                    error_msg = response_data.get('message', 'Unknown error')
+                                    raise Exception(f"API error: {error_msg} (code: {response_data.get('code')})")
+                            elif response.status == 401:
+                                raise Exception("Unauthorized - Invalid API key")
+                            elif response.status == 429:
+                                raise Exception("Rate limit exceeded - Too many requests")
+                            else:
+                                raise Exception(f"HTTP {response.status}: {response_data}")
                 
-                if response.status == 200:
-                    if response_data.get("code") == 200:
-                        return response_data
-                    else:
-                        error_msg = response_data.get('message', 'Unknown error')
-                        raise Exception(f"API error: {error_msg} (code: {response_data.get('code')})")
-                elif response.status == 401:
-                    raise Exception("Unauthorized - Invalid API key")
-                elif response.status == 429:
-                    raise Exception("Rate limit exceeded - Too many requests")
-                else:
-                    raise Exception(f"HTTP {response.status}: {response_data}")
+                # Back off outside the concurrency limit so other requests can proceed
+                await asyncio.sleep(delay)
                     
         except aiohttp.ClientError as e:
             raise Exception(f"Network error: {str(e)}")
         except Exception as e:
             raise Exception(f"Request failed: {str(e)}")
 
+    def _retry_delay(self, response: aiohttp.ClientResponse, attempt: int) -> float:
+        """Backoff delay for a retryable response, honoring Retry-After on 429."""
+        if response.status == 429:
+            try:
+                return float(response.headers.get("Retry-After", 2 ** attempt))
+            except ValueError:
+                return float(2 ** attempt)
+        return min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** attempt) + random.random()
+
+    def _update_rate_limit(self, headers) -> None:
+        """Pre-throttle when the API reports less than 10% of the quota remaining."""
+        for prefix in ("X-RateLimit-", "API-RateLimit-"):
+            remaining = headers.get(f"{prefix}Remaining")
+            limit = headers.get(f"{prefix}Limit")
+            if remaining is None or limit is None:
+                continue
+            try:
+                remaining, limit = int(remaining), int(limit)
+                reset = float(headers.get(f"{prefix}Reset", 0))
+            except ValueError:
+                continue
+            
+            if limit > 0 and remaining < limit * 0.1:
+                # Reset may be an epoch timestamp or a number of seconds
+                reset_in = reset - time.time() if reset > 1e9 else reset
+                if reset_in <= 0:
+                    reset_in = 60.0 / self.RATE_LIMIT_PER_MINUTE
+                # Spread the remaining quota evenly until the window resets
+                self._rate_limiter.pause(reset_in / max(remaining, 1))
+            return
+
     async def test_connection(self) -> bool:
         """Test API connection."""
         try:
@@ -109,13 +488,52 @@ class GoveeAPIDiscovery:
             print(f"❌ Connection test failed: {e}")
             return False
 
+    def _load_devices_cache(self) -> Optional[Dict[str, Any]]:
+        """Load the cached device list for this API key, if any."""
+        try:
+            cache = _json_loads(self.DEVICES_CACHE_PATH.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cache, dict) or cache.get("key") != self._cache_key:
+            return None
+        return cache
+
+    def _save_devices_cache(self, devices_data: List[Dict[str, Any]], etag: Optional[str]) -> None:
+        try:
+            self.DEVICES_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            self.DEVICES_CACHE_PATH.write_bytes(
+                _json_dumps({"key": self._cache_key, "etag": etag, "devices": devices_data})
+            )
+        except OSError as e:
+            print(f"⚠️  Could not write device cache: {e}")
+
     async def get_all_devices(self) -> List[Dict[str, Any]]:
-        """Fetch all devices from Govee API."""
+        """Fetch all devices from Govee API (cached on disk for DEVICES_CACHE_TTL seconds)."""
+        endpoint = "/router/api/v1/user/devices"
+        cache = self._load_devices_cache()
+        
+        if cache is not None:
+            age = time.time() - self.DEVICES_CACHE_PATH.stat().st_mtime
+            if age < self.DEVICES_CACHE_TTL:
+                devices_data = cache.get("devices", [])
+                print(f"\n💾 Using cached device list ({int(age)}s old): {len(devices_data)} device(s)")
+                return devices_data
+        
         print("\n🔍 Fetching devices from Govee API...")
         
         try:
-            response = await self._make_request("GET", "/router/api/v1/user/devices")
+            headers = {"If-None-Match": cache["etag"]} if cache and cache.get("etag") else None
+            response = await self._make_request("GET", endpoint, headers=headers)
+            
+            if response is None:
+                # 304 Not Modified - cached list is still current
+                devices_data = cache.get("devices", [])
+                self.DEVICES_CACHE_PATH.touch()
+                print(f"✅ Device list unchanged: {len(devices_data)} device(s)")
+                return devices_data
+            
             devices_data = response.get("data", [])
+            self._save_devices_cache(devices_data, self._etags.get(endpoint))
             
             print(f"✅ Successfully discovered {len(devices_data)} device(s)")
             return devices_data
@@ -129,13 +547,31 @@ class GoveeAPIDiscovery:
         try:
             # Note: This endpoint may not work for all devices
             # Govee API has limitations on state queries
-            endpoint = f"/router/api/v1/device/state?sku={sku}&device={device_id}"
-            response = await self._make_request("GET", endpoint)
+            response = await self._make_request(
+                "GET", "/router/api/v1/device/state",
+                params={"sku": sku, "device": device_id}
+            )
             return response.get("data", {})
         except Exception as e:
             # State query might fail for some devices - this is normal
             return {"error": str(e), "note": "State query not supported for this device"}
 
+    def _summarize_capabilities(self, capabilities: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the capability summary for a device's capability list."""
+        capability_summary = CapabilitySummary()
+        
+        for cap in capabilities:
+            # JSON-decoded strings are not interned; intern once per capability
+            cap_type = sys.intern(cap.get("type") or "")
+            handler = (
+                _CAPABILITY_HANDLERS.get((cap_type, sys.intern(cap.get("instance") or "")))
+                or _CAPABILITY_HANDLERS.get(cap_type)
+                or _handle_custom
+            )
+            handler(capability_summary, cap)
+        
+        return asdict(capability_summary)
+
     def analyze_device(self, device_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze device capabilities and structure."""
         sku = device_data.get("sku", "Unknown")
@@ -144,109 +580,11 @@ class GoveeAPIDiscovery:
         api_type = device_data.get("type", "Unknown")
         capabilities = device_data.get("capabilities", [])
         
-        # Analyze capabilities
-        capability_summary = {
-            "power_control": False,
-            "brightness_control": False,
-            "color_control": False,
-            "color_temperature": False,
-            "temperature_setting": False,
-            "work_modes": [],
-            "dynamic_scenes": [],
-            "music_setting": False,
-            "timer_support": False,
-            "range_controls": [],
-            "custom_capabilities": []
-        }
-        
-        for cap in capabilities:
-            cap_type = cap.get("type", "")
-            cap_instance = cap.get("instance", "")
-            cap_params = cap.get("parameters", {})
-            
-            # Power control
-            if cap_type == "devices.capabilities.on_off":
-                capability_summary["power_control"] = True
-            
-            # Brightness
-            elif cap_type == "devices.capabilities.range" and cap_instance == "brightness":
-                capability_summary["brightness_control"] = True
-                capability_summary["range_controls"].append({
-                    "type": "brightness",
-                    "range": cap_params.get("range", {}),
-                    "unit": cap_params.get("unit", "")
-                })
-            
-            # Color RGB
-            elif cap_type == "devices.capabilities.color_setting" and cap_instance == "colorRgb":
-                capability_summary["color_control"] = True
-            
-            # Color Temperature
-            elif cap_type == "devices.capabilities.color_setting" and cap_instance == "colorTemperatureK":
-                capability_summary["color_temperature"] = True
-                capability_summary["range_controls"].append({
-                    "type": "color_temperature",
-                    "range": cap_params.get("range", {}),
-                    "unit": "Kelvin"
-                })
-            
-            # Temperature setting
-            elif cap_type == "devices.capabilities.temperature_setting":
-                capability_summary["temperature_setting"] = True
-                if "fields" in cap_params:
-                    for field in cap_params["fields"]:
-                        if field.get("fieldName") == "temperature":
-                            capability_summary["range_controls"].append({
-                                "type": "temperature",
-                                "range": field.get("range", {}),
-                                "unit": "Celsius"
-                            })
-            
-            # Work modes
-            elif cap_type == "devices.capabilities.work_mode":
-                if "fields" in cap_params:
-                    for field in cap_params["fields"]:
-                        if field.get("fieldName") == "workMode" and "options" in field:
-                            for option in field["options"]:
-                                capability_summary["work_modes"].append({
-                                    "instance": cap_instance,
-                                    "name": option.get("name"),
-                                    "value": option.get("value")
-                                })
-            
-            # Dynamic scenes
-            elif cap_type == "devices.capabilities.dynamic_scene":
-                if "options" in cap_params:
-                    for option in cap_params["options"]:
-                        capability_summary["dynamic_scenes"].append({
-                            "instance": cap_instance,
-                            "name": option.get("name"),
-                            "value": option.get("value")
-                        })
-            
-            # Music setting
-            elif cap_type == "devices.capabilities.music_setting":
-                capability_summary["music_setting"] = True
-            
-            # Timer
-            elif cap_type == "devices.capabilities.timer":
-                capability_summary["timer_support"] = True
-            
-            # Range controls (generic)
-            elif cap_type == "devices.capabilities.range":
-                capability_summary["range_controls"].append({
-                    "type": cap_instance,
-                    "range": cap_params.get("range", {}),
-                    "unit": cap_params.get("unit", "")
-                })
-            
-            # Custom/Unknown capabilities
-            else:
-                capability_summary["custom_capabilities"].append({
-                    "type": cap_type,
-                    "instance": cap_instance,
-                    "parameters": cap_params
-                })
+        capability_summary = self._analysis_cache.get(sku)
+        if capability_summary is None:
+            capability_summary = self._summarize_capabilities(capabilities)
+            if sku != "Unknown":
+                self._analysis_cache[sku] = capability_summary
         
         return {
             "sku": sku,
@@ -263,15 +601,15 @@ class GoveeAPIDiscovery:
         print("🔧 GOVEE API DEVICE DISCOVERY TOOL")
         print("="*70)
         
-        # Test connection
+        # Fetching the device list doubles as the connection test, so the list is
+        # requested once; a fresh cache for this API key skips the network entirely
         print("\n📡 Testing API connection...")
-        if not await self.test_connection():
+        try:
+            devices_data = await self.get_all_devices()
+        except Exception:
             raise Exception("Failed to connect to Govee API")
         print("✅ API connection successful")
         
-        # Get all devices
-        devices_data = await self.get_all_devices()
-        
         if not devices_data:
             print("\n⚠️  No devices found in your Govee account")
             return {
@@ -280,40 +618,54 @@ class GoveeAPIDiscovery:
                 "devices": []
             }
         
+        # Query device states concurrently (may fail for some devices), skipping
+        # devices whose state query is known to be unsupported
+        queryable = [d for d in devices_data if supports_state_query(d)]
+        print(f"\n📡 Querying state for {len(queryable)}/{len(devices_data)} device(s)...")
+        results = await asyncio.gather(
+            *(self.get_device_state(d.get("sku", "Unknown"), d.get("device", "")) for d in queryable),
+            return_exceptions=True
+        )
+        states_by_device = {id(d): state for d, state in zip(queryable, results)}
+        states = [states_by_device.get(id(d)) for d in devices_data]
+        
         # Analyze each device
         print("\n📊 Analyzing device capabilities...")
         analyzed_devices = []
         
-        for idx, device_data in enumerate(devices_data, 1):
+        for idx, (device_data, state) in enumerate(zip(devices_data, states), 1):
             device_name = device_data.get("deviceName", "Unknown")
             sku = device_data.get("sku", "Unknown")
             
-            print(f"\n  [{idx}/{len(devices_data)}] {device_name} (SKU: {sku})")
+            lines = [f"\n  [{idx}/{len(devices_data)}] {device_name} (SKU: {sku})"]
             
             # Analyze device
             analysis = self.analyze_device(device_data)
             
-            # Try to get device state (may fail for some devices)
-            print(f"      Querying device state...", end=" ")
-            state = await self.get_device_state(sku, device_data.get("device", ""))
-            if "error" not in state:
+            if isinstance(state, dict) and "error" not in state:
                 analysis["current_state"] = state
-                print("✅")
+                lines.append("      Device state: ✅")
+            elif state is None:
+                analysis["current_state"] = None
+                lines.append("      Device state: ⏭️  (not supported, skipped)")
             else:
                 analysis["current_state"] = None
-                print("⚠️  (not available)")
+                lines.append("      Device state: ⚠️  (not available)")
             
             analyzed_devices.append(analysis)
             
-            # Print capability summary
+            # Capability summary, written in one call per device
             cap_summary = analysis["capability_summary"]
-            print(f"      Capabilities:")
-            print(f"        • Power: {cap_summary['power_control']}")
-            print(f"        • Brightness: {cap_summary['brightness_control']}")
-            print(f"        • Color: {cap_summary['color_control']}")
-            print(f"        • Work Modes: {len(cap_summary['work_modes'])}")
-            print(f"        • Scenes: {len(cap_summary['dynamic_scenes'])}")
-            print(f"        • Custom: {len(cap_summary['custom_capabilities'])}")
+            lines.extend((
+                "      Capabilities:",
+                f"        • Power: {cap_summary['power_control']}",
+                f"        • Brightness: {cap_summary['brightness_control']}",
+                f"        • Color: {cap_summary['color_control']}",
+                f"        • Work Modes: {len(cap_summary['work_modes'])}",
+                f"        • Scenes: {len(cap_summary['dynamic_scenes'])}",
+                f"        • Custom: {len(cap_summary['custom_capabilities'])}",
+            ))
+            sys.stdout.write("\n".join(lines) + "\n")
         
         return {
             "timestamp": datetime.now().isoformat(),
@@ -350,6 +702,7 @@ def print_instructions():
 
 ⚠️  IMPORTANT:
    • Your API key is stored ONLY in this script execution
+   • The device list is cached in ~/.cache/govee_discovery.json for 10 minutes
    • No data is sent anywhere except Govee's official API
    • The output JSON can be safely shared (device IDs are included but not sensitive)
    • Keep your API key private - never share it publicly
@@ -380,11 +733,11 @@ def get_api_key() -> str:
 def save_results(results: Dict[str, Any], filename: str = "govee_discovery_output.json"):
     """Save results to JSON file."""
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        with open(filename, 'wb') as f:
+            f.write(_json_dumps(results))
         
         print(f"\n✅ Results saved to: {filename}")
-        print(f"   File size: {len(json.dumps(results, indent=2)) / 1024:.2f} KB")
+        print(f"   File size: {os.path.getsize(filename) / 1024:.2f} KB")
         return True
     except Exception as e:
         print(f"\n❌ Failed to save results: {e}")
@@ -426,21 +779,15 @@ def print_summary(results: Dict[str, Any]):
     print("\n" + "="*70)
 
 
-async def main():
+async def main(api_key: str):
     """Main entry point."""
-    print_banner()
-    print_instructions()
-    
-    # Get API key from user
-    api_key = get_api_key()
-    
     # Run discovery
     try:
         async with GoveeAPIDiscovery(api_key) as discovery:
             results = await discovery.discover_and_analyze()
         
-        # Save results
-        if save_results(results):
+        # Save results without blocking the event loop on file I/O
+        if await asyncio.to_thread(save_results, results):
             print_summary(results)
             
             print("\n✅ SUCCESS!")
@@ -462,11 +809,28 @@ async def main():
         print("   • Ensure Govee API is accessible")
         print("   • Try again in a few minutes (rate limiting)")
         exit(1)
+    
+    finally:
+        await close_shared_connector()
 
 
 if __name__ == "__main__":
+    # uvloop speeds up concurrent aiohttp requests; not available on Windows
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+    
     try:
-        asyncio.run(main())
+        print_banner()
+        print_instructions()
+        
+        # Prompt before starting the event loop so Ctrl+C at the prompt exits cleanly
+        api_key = get_api_key()
+        
+        asyncio.run(main(api_key))
     except KeyboardInterrupt:
         print("\n\n👋 Goodbye!")
     except Exception as e:
@@ -6,15 +6,47 @@ Govee API client implementation.
 """
 
 import asyncio
+import functools
 import logging
+import random
 import ssl
+import time
+import uuid
+from collections import defaultdict
 from typing import Any, Dict, List, Optional
 
 import aiohttp
-from asyncio_throttle import Throttler
+import orjson
 
 _LOG = logging.getLogger(__name__)
 
+_SYNC_BOX_SKUS = frozenset({"H6603", "H6604", "H8604"})
+
+_API_TYPE_MAP = {
+    "devices.types.light": "light",
+    "devices.types.switch": "switch",
+    "devices.types.socket": "socket",
+    "devices.types.kettle": "kettle",
+    "devices.types.humidifier": "humidifier",
+    "devices.types.air_purifier": "air_purifier",
+    "devices.types.heater": "heater",
+    "devices.types.thermometer": "thermometer",
+    "devices.types.air_quality_monitor": "sensor",
+    "devices.types.fan": "fan",
+    "devices.types.dehumidifier": "dehumidifier",
+    "devices.types.ice_maker": "ice_maker",
+    "devices.types.aroma_diffuser": "aroma_diffuser"
+}
+
+
+def _clamp(value, low, high):
+    return low if value < low else high if value > high else value
+
+
+def _json_serialize(obj: Any) -> str:
+    """orjson-backed serializer for aiohttp request bodies (aiohttp expects str)."""
+    return orjson.dumps(obj).decode("utf-8")
+
 
 class GoveeAPIError(Exception):
     """Custom exception for Govee API errors."""
@@ -24,14 +56,139 @@ class GoveeAPIError(Exception):
         self.code = code
 
 
+@functools.lru_cache(maxsize=None)
+def _ssl_context(verify: bool) -> ssl.SSLContext:
+    """Return a shared SSL context; loading the trust store is costly, so build each mode once."""
+    ssl_context = ssl.create_default_context()
+    if not verify:
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+    return ssl_context
+
+
+def _memoized(method):
+    """Cache a GoveeDevice getter; capabilities never change after construction."""
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self):
+        try:
+            return self._memo[name]
+        except KeyError:
+            value = self._memo[name] = method(self)
+            return value
+
+    return wrapper
+
+
+# Rate-limit header families: per-minute API-RateLimit-* and the daily X-RateLimit-* quota
+_RATE_LIMIT_PREFIXES = ("API-RateLimit-", "X-RateLimit-")
+
+
+def _seconds_until_reset(reset: float) -> float:
+    """Seconds until a rate-limit window resets; the header may be relative, epoch seconds or epoch ms."""
+    if reset > 1e12:
+        reset /= 1000.0
+    if reset > 1e9:
+        reset -= time.time()
+    return max(0.0, reset)
+
+
+class RateLimiter:
+    """Request limiter driven by the rate-limit headers returned by the Govee API.
+
+    Requests go out immediately while the quota is comfortable. Once fewer than
+    PACING_FLOOR requests remain they are spread over the rest of the window, and
+    they are held back once the quota is exhausted or the API answers with HTTP 429.
+    No request waits longer than MAX_WAIT; one that would is rejected with a 429
+    GoveeAPIError instead.
+    """
+
+    # Start pacing requests only when the remaining quota drops below this
+    PACING_FLOOR = 5
+    # Longest a single request may be held back, in seconds; the daily quota window
+    # could otherwise pace a button press for hours
+    MAX_WAIT = 5.0
+    # Upper bound on the spacing between paced requests, in seconds
+    MAX_INTERVAL = 1.0
+
+    def __init__(self, max_concurrent: int = 10) -> None:
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._next_allowed = 0.0
+        self._interval = 0.0
+
+    async def __aenter__(self):
+        now = time.monotonic()
+        start = max(now, self._next_allowed)
+        wait = start - now
+        if wait > self.MAX_WAIT:
+            raise GoveeAPIError(f"Rate limit exceeded - requests paused for {wait:.0f}s", 429)
+        self._next_allowed = start + self._interval
+        # Wait for the slot before taking a concurrency permit, so paced requests don't hold one
+        if wait > 0:
+            await asyncio.sleep(wait)
+        await self._semaphore.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._semaphore.release()
+
+    def defer(self, seconds: float) -> None:
+        """Hold back all requests for the given number of seconds, at most MAX_WAIT."""
+        self._next_allowed = max(self._next_allowed, time.monotonic() + min(seconds, self.MAX_WAIT))
+
+    def update(self, headers) -> None:
+        """Adjust pacing from the API-RateLimit-* and X-RateLimit-* Remaining/Reset headers."""
+        interval = None
+        for prefix in _RATE_LIMIT_PREFIXES:
+            remaining = headers.get(f"{prefix}Remaining")
+            reset = headers.get(f"{prefix}Reset")
+            if remaining is None or reset is None:
+                continue
+            try:
+                remaining = int(remaining)
+                until_reset = _seconds_until_reset(float(reset))
+            except ValueError:
+                continue
+            
+            # The most restrictive window wins
+            interval = interval or 0.0
+            if remaining <= 0:
+                self.defer(until_reset)
+            elif remaining < self.PACING_FLOOR:
+                interval = max(interval, until_reset / remaining)
+        
+        if interval is not None:
+            self._interval = min(interval, self.MAX_INTERVAL)
+
+
 class GoveeDevice:
     """Represents a Govee device with its capabilities."""
 
+    __slots__ = (
+        "sku", "device_id", "device_name", "capabilities", "api_type",
+        "supports_power", "supports_brightness", "supports_color", "supports_color_temp",
+        "supports_scenes", "supports_music", "supports_temperature", "supports_work_mode",
+        "supports_timer", "supports_humidity", "supports_fan_mode", "supports_gradient",
+        "supports_dreamview", "supports_segmented", "device_type",
+        "brightness_range", "color_temp_range", "temperature_range",
+        "_cap_index", "_cap_by_type", "_ctrl_template", "_memo",
+    )
+
     def __init__(self, data: Dict[str, Any]) -> None:
         self.sku = data.get("sku", "")
         self.device_id = data.get("device", "")
         self.device_name = data.get("deviceName", f"Govee {self.sku}")
         self.capabilities = data.get("capabilities", [])
+        self._memo: Dict[str, Any] = {}
+        
+        # Index capabilities once so lookups below are dict hits, not list scans.
+        # setdefault keeps the first match, as the previous linear scan did.
+        self._cap_index: Dict[tuple, Dict[str, Any]] = {}
+        self._cap_by_type: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for cap in self.capabilities:
+            self._cap_index.setdefault((cap.get("type"), cap.get("instance")), cap)
+            self._cap_by_type[cap.get("type")].append(cap)
         
         self.api_type = data.get("type", "")
         
@@ -53,32 +210,25 @@ class GoveeDevice:
         self.supports_dreamview = self._has_capability("devices.capabilities.toggle", "dreamViewToggle")
         self.supports_segmented = self._has_capability("devices.capabilities.segment_color_setting")
         
+        # Control request body reused across commands, built by GoveeClient on first use
+        self._ctrl_template: Optional[Dict[str, Any]] = None
+        
         # NOW determine device type after all capabilities are set
         self.device_type = self._determine_device_type()
+        
+        # Clamp bounds used by the GoveeClient setters (API defaults when not reported)
+        self.brightness_range = self.get_brightness_range()
+        self.color_temp_range = self.get_color_temp_range()
+        self.temperature_range = self.get_temperature_range()
 
     def _determine_device_type(self) -> str:
-        if self.sku in ["H6603", "H6604", "H8604"]:
+        if self.sku in _SYNC_BOX_SKUS:
             return "sync_box"
         
         if self.api_type:
-            type_mapping = {
-                "devices.types.light": "light",
-                "devices.types.switch": "switch", 
-                "devices.types.socket": "socket",
-                "devices.types.kettle": "kettle",
-                "devices.types.humidifier": "humidifier",
-                "devices.types.air_purifier": "air_purifier",
-                "devices.types.heater": "heater",
-                "devices.types.thermometer": "thermometer",
-                "devices.types.air_quality_monitor": "sensor",
-                "devices.types.fan": "fan",
-                "devices.types.dehumidifier": "dehumidifier",
-                "devices.types.ice_maker": "ice_maker",
-                "devices.types.aroma_diffuser": "aroma_diffuser"
-            }
-            mapped_type = type_mapping.get(self.api_type)
+            mapped_type = _API_TYPE_MAP.get(self.api_type)
             if mapped_type:
-                _LOG.debug(f"Device type from API: {self.api_type} -> {mapped_type}")
+                _LOG.debug("Device type from API: %s -> %s", self.api_type, mapped_type)
                 return mapped_type
         
         if self.supports_color or self.supports_brightness:
@@ -91,18 +241,14 @@ class GoveeDevice:
             return "sensor"
 
     def _has_capability(self, capability_type: str, instance: Optional[str] = None) -> bool:
-        for cap in self.capabilities:
-            if cap.get("type") == capability_type:
-                if instance is None or cap.get("instance") == instance:
-                    return True
-        return False
+        if instance is None:
+            return capability_type in self._cap_by_type
+        return (capability_type, instance) in self._cap_index
 
     def get_capability(self, capability_type: str, instance: str) -> Optional[Dict[str, Any]]:
-        for cap in self.capabilities:
-            if cap.get("type") == capability_type and cap.get("instance") == instance:
-                return cap
-        return None
+        return self._cap_index.get((capability_type, instance))
 
+    @_memoized
     def get_brightness_range(self) -> tuple[int, int]:
         cap = self.get_capability("devices.capabilities.range", "brightness")
         if cap and "parameters" in cap:
@@ -110,6 +256,7 @@ class GoveeDevice:
             return (range_info.get("min", 1), range_info.get("max", 100))
         return (1, 100)
 
+    @_memoized
     def get_color_temp_range(self) -> tuple[int, int]:
         cap = self.get_capability("devices.capabilities.color_setting", "colorTemperatureK")
         if cap and "parameters" in cap:
@@ -117,6 +264,7 @@ class GoveeDevice:
             return (range_info.get("min", 2000), range_info.get("max", 9000))
         return (2000, 9000)
 
+    @_memoized
     def get_temperature_range(self) -> tuple[int, int]:
         cap = self.get_capability("devices.capabilities.temperature_setting", "sliderTemperature")
         if cap and "parameters" in cap and "fields" in cap["parameters"]:
@@ -132,22 +280,23 @@ class GoveeDevice:
         
         return (20, 100)
 
+    @_memoized
     def get_work_modes(self) -> List[Dict[str, Any]]:
         modes = []
-        for cap in self.capabilities:
-            if cap.get("type") == "devices.capabilities.work_mode":
-                params = cap.get("parameters", {})
-                if "fields" in params:
-                    for field in params["fields"]:
-                        if field.get("fieldName") == "workMode" and "options" in field:
-                            for option in field["options"]:
-                                modes.append({
-                                    "instance": cap.get("instance", ""),
-                                    "name": option.get("name"),
-                                    "value": option.get("value")
-                                })
+        for cap in self._cap_by_type.get("devices.capabilities.work_mode", ()):
+            params = cap.get("parameters", {})
+            if "fields" in params:
+                for field in params["fields"]:
+                    if field.get("fieldName") == "workMode" and "options" in field:
+                        for option in field["options"]:
+                            modes.append({
+                                "instance": cap.get("instance", ""),
+                                "name": option.get("name"),
+                                "value": option.get("value")
+                            })
         return modes
 
+    @_memoized
     def get_music_modes(self) -> List[Dict[str, Any]]:
         modes = []
         cap = self.get_capability("devices.capabilities.music_setting", "musicMode")
@@ -161,21 +310,22 @@ class GoveeDevice:
                         })
         return modes
 
+    @_memoized
     def get_scene_options(self) -> List[Dict[str, Any]]:
         scenes = []
-        for cap in self.capabilities:
-            if cap.get("type") == "devices.capabilities.dynamic_scene":
-                params = cap.get("parameters", {})
-                if "options" in params:
-                    instance = cap.get("instance", "")
-                    for option in params["options"]:
-                        scenes.append({
-                            "instance": instance,
-                            "name": option.get("name"),
-                            "value": option.get("value")
-                        })
+        for cap in self._cap_by_type.get("devices.capabilities.dynamic_scene", ()):
+            params = cap.get("parameters", {})
+            if "options" in params:
+                instance = cap.get("instance", "")
+                for option in params["options"]:
+                    scenes.append({
+                        "instance": instance,
+                        "name": option.get("name"),
+                        "value": option.get("value")
+                    })
         return scenes
 
+    @_memoized
     def get_all_capabilities_summary(self) -> Dict[str, Any]:
         return {
             "device_type": self.device_type,
@@ -210,13 +360,24 @@ class GoveeClient:
     """Govee API client with rate limiting and error handling."""
 
     BASE_URL = "https://openapi.api.govee.com"
+    MAX_RETRIES = 4
+    RETRY_BASE_DELAY = 1.0
+    RETRY_MAX_DELAY = 30.0
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    # Control POSTs are not idempotent: retry them only when the API cannot have acted on
+    # them (connection refused, 429), and give up sooner so a button press never hangs
+    CONTROL_MAX_RETRIES = 2
+    CONTROL_RETRY_STATUSES = frozenset({429})
+    CONTROL_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=5)
     
     def __init__(self, api_key: str) -> None:
         self.api_key = api_key
         self._api_key = api_key
         self.session: Optional[aiohttp.ClientSession] = None
         
-        self.throttler = Throttler(rate_limit=10, period=60)
+        self._limiter = RateLimiter()
+        # One session is shared for the client's lifetime; created lazily on first request
+        self._connect_lock = asyncio.Lock()
         
         self._headers = {
             "Content-Type": "application/json",
@@ -233,98 +394,144 @@ class GoveeClient:
         await self.disconnect()
 
     async def connect(self) -> None:
-        if self.session is None:
-            ssl_context = ssl.create_default_context()
-            
-            connector = aiohttp.TCPConnector(
-                ssl=ssl_context,
-                ttl_dns_cache=300,
-                use_dns_cache=True,
-            )
-            
-            timeout = aiohttp.ClientTimeout(total=30, connect=10)
-            self.session = aiohttp.ClientSession(
-                headers=self._headers,
-                timeout=timeout,
-                connector=connector
-            )
+        if self.session is None or self.session.closed:
+            self.session = self._build_session(_ssl_context(verify=True))
+
+    def _build_session(self, ssl_context: ssl.SSLContext) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            ssl=ssl_context,
+            ttl_dns_cache=300,
+            use_dns_cache=True,
+            limit=64,
+            limit_per_host=32,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True,
+            force_close=False,
+        )
+        
+        timeout = aiohttp.ClientTimeout(total=30, connect=10)
+        return aiohttp.ClientSession(
+            headers=self._headers,
+            timeout=timeout,
+            connector=connector,
+            json_serialize=_json_serialize
+        )
 
     async def disconnect(self) -> None:
         if self.session:
             await self.session.close()
             self.session = None
 
+    def set_api_key(self, api_key: str) -> None:
+        """Use a new API key for subsequent requests, including on an already open session."""
+        self.api_key = api_key
+        self._api_key = api_key
+        self._headers["Govee-API-Key"] = api_key
+        if self.session is not None:
+            # ClientSession copies default headers at construction, so update its copy too
+            self.session.headers["Govee-API-Key"] = api_key
+
     def is_configured(self) -> bool:
         return self._api_key is not None and self._api_key.strip() != ""
 
-    async def _make_request(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        if not self.session:
-            await self.connect()
+    async def _make_request(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None,
+                            body: Optional[bytes] = None) -> Dict[str, Any]:
+        if self.session is None or self.session.closed:
+            async with self._connect_lock:
+                if self.session is None or self.session.closed:
+                    await self.connect()
 
         url = f"{self.BASE_URL}{endpoint}"
+        ssl_fallback_used = False
         
-        async with self.throttler:
-            try:
-                async with self.session.request(method, url, json=data) as response:
-                    response_data = await response.json()
-                    
-                    if response.status == 200:
-                        if response_data.get("code") == 200:
-                            return response_data
+        # A control POST that timed out may already have reached the device; sending it
+        # again could undo it (a toggle flips back), so only GETs get the full retry loop
+        idempotent = method == "GET"
+        if idempotent:
+            max_retries, retry_statuses, request_options = self.MAX_RETRIES, self.RETRY_STATUSES, {}
+        else:
+            max_retries, retry_statuses = self.CONTROL_MAX_RETRIES, self.CONTROL_RETRY_STATUSES
+            request_options = {"timeout": self.CONTROL_TIMEOUT}
+        
+        for attempt in range(max_retries):
+            last_attempt = attempt == max_retries - 1
+            delay = 0.0
+            
+            async with self._limiter:
+                try:
+                    async with self.session.request(method, url, json=data, data=body, **request_options) as response:
+                        self._limiter.update(response.headers)
+                        
+                        if response.status in retry_statuses and not last_attempt:
+                            delay = self._retry_delay(response, attempt)
+                            _LOG.warning("Govee API returned HTTP %s, retrying in %.1fs", response.status, delay)
+                            if response.status == 429:
+                                # Back off every request, not just this one - the quota is per account
+                                self._limiter.defer(delay)
+                                delay = 0.0
                         else:
+                            # Decide on the status first: error bodies are often plain text or HTML
+                            if response.status == 401:
+                                raise GoveeAPIError("Unauthorized - check your API key", 401)
+                            elif response.status == 429:
+                                raise GoveeAPIError("Rate limit exceeded - too many requests", 429)
+                            elif response.status != 200:
+                                detail = (await response.read())[:200].decode("utf-8", errors="replace")
+                                raise GoveeAPIError(f"HTTP {response.status}: {detail}", response.status)
+                            
+                            try:
+                                response_data = orjson.loads(await response.read())
+                            except orjson.JSONDecodeError as e:
+                                raise GoveeAPIError(f"Invalid JSON in API response: {e}", response.status)
+                            
+                            if response_data.get("code") == 200:
+                                return response_data
                             raise GoveeAPIError(
                                 f"API error: {response_data.get('message', 'Unknown error')}",
                                 response_data.get("code")
                             )
-                    elif response.status == 401:
-                        raise GoveeAPIError("Unauthorized - check your API key", 401)
-                    elif response.status == 429:
-                        raise GoveeAPIError("Rate limit exceeded - too many requests", 429)
-                    else:
-                        raise GoveeAPIError(f"HTTP {response.status}: {response_data}", response.status)
-                        
-            except ssl.SSLError as e:
-                _LOG.error(f"SSL Error connecting to Govee API: {e}")
-                await self._reconnect_with_fallback_ssl()
-                try:
-                    async with self.session.request(method, url, json=data) as response:
-                        response_data = await response.json()
-                        
-                        if response.status == 200 and response_data.get("code") == 200:
-                            return response_data
-                        else:
-                            raise GoveeAPIError(f"API error after SSL fallback: {response_data.get('message', 'Unknown error')}")
                             
-                except Exception as retry_e:
-                    raise GoveeAPIError(f"SSL connection failed even with fallback: {str(retry_e)}")
-                    
-            except aiohttp.ClientError as e:
-                raise GoveeAPIError(f"Network error: {str(e)}")
-            except Exception as e:
-                raise GoveeAPIError(f"Unexpected error: {str(e)}")
+                except ssl.SSLError as e:
+                    if ssl_fallback_used:
+                        raise GoveeAPIError(f"SSL connection failed even with fallback: {str(e)}")
+                    _LOG.error("SSL Error connecting to Govee API: %s", e)
+                    await self._reconnect_with_fallback_ssl()
+                    ssl_fallback_used = True
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    if last_attempt or not (idempotent or isinstance(e, aiohttp.ClientConnectorError)):
+                        raise GoveeAPIError(f"Network error: {str(e)}")
+                    delay = self._backoff_delay(attempt)
+                    _LOG.warning("Network error talking to Govee API (%r), retrying in %.1fs", e, delay)
+                except GoveeAPIError:
+                    raise
+                except Exception as e:
+                    raise GoveeAPIError(f"Unexpected error: {str(e)}")
+            
+            # Sleep outside the limiter so other requests are not held up
+            if delay:
+                await asyncio.sleep(delay)
+        
+        raise GoveeAPIError(f"Request to {endpoint} failed after {max_retries} attempts")
+
+    def _backoff_delay(self, attempt: int) -> float:
+        return min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** attempt) + random.random()
+
+    def _retry_delay(self, response: aiohttp.ClientResponse, attempt: int) -> float:
+        """Delay before retrying a 429/5xx response, honoring Retry-After on 429."""
+        if response.status == 429:
+            try:
+                retry_after = float(response.headers.get("Retry-After", 1))
+            except ValueError:
+                retry_after = 1.0
+            return min(self.RETRY_MAX_DELAY, retry_after * 2 ** attempt)
+        return self._backoff_delay(attempt)
 
     async def _reconnect_with_fallback_ssl(self) -> None:
         if self.session:
             await self.session.close()
-            
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
         
         _LOG.warning("Using fallback SSL settings due to certificate verification issues")
-        
-        connector = aiohttp.TCPConnector(
-            ssl=ssl_context,
-            ttl_dns_cache=300,
-            use_dns_cache=True,
-        )
-        
-        timeout = aiohttp.ClientTimeout(total=30, connect=10)
-        self.session = aiohttp.ClientSession(
-            headers=self._headers,
-            timeout=timeout,
-            connector=connector
-        )
+        self.session = self._build_session(_ssl_context(verify=False))
 
     async def get_devices(self) -> List[GoveeDevice]:
         _LOG.info("Fetching devices from Govee API")
@@ -333,25 +540,25 @@ class GoveeClient:
             response = await self._make_request("GET", "/router/api/v1/user/devices")
             devices_data = response.get("data", [])
             
-            devices = []
-            for device_data in devices_data:
-                device = GoveeDevice(device_data)
-                devices.append(device)
-                _LOG.debug(f"Found device: {device}")
-                _LOG.debug(f"Device capabilities: {device.get_all_capabilities_summary()}")
+            devices = [GoveeDevice(device_data) for device_data in devices_data]
             
-            _LOG.info(f"Successfully discovered {len(devices)} Govee devices")
+            if _LOG.isEnabledFor(logging.DEBUG):
+                for device in devices:
+                    _LOG.debug("Found device: %s", device)
+                    _LOG.debug("Device capabilities: %s", device.get_all_capabilities_summary())
+            
+            _LOG.info("Successfully discovered %s Govee devices", len(devices))
             return devices
             
         except GoveeAPIError as e:
-            _LOG.error(f"Failed to get devices: {e}")
+            _LOG.error("Failed to get devices: %s", e)
             raise
         except Exception as e:
-            _LOG.error(f"Unexpected error getting devices: {e}")
+            _LOG.error("Unexpected error getting devices: %s", e)
             raise GoveeAPIError(f"Failed to get devices: {str(e)}")
 
     async def get_device_state(self, device: GoveeDevice) -> Dict[str, Any]:
-        _LOG.debug(f"Getting state for device: {device.device_id}")
+        _LOG.debug("Getting state for device: %s", device.device_id)
         
         try:
             params = {
@@ -363,39 +570,61 @@ class GoveeClient:
             return response.get("data", {})
             
         except GoveeAPIError as e:
-            _LOG.error(f"Failed to get device state for {device.device_id}: {e}")
+            _LOG.error("Failed to get device state for %s: %s", device.device_id, e)
             raise
         except Exception as e:
-            _LOG.error(f"Unexpected error getting device state: {e}")
+            _LOG.error("Unexpected error getting device state: %s", e)
             raise GoveeAPIError(f"Failed to get device state: {str(e)}")
 
+    async def get_device_states(self, devices: List[GoveeDevice], concurrency: int = 16) -> Dict[str, Any]:
+        """Fetch state for several devices concurrently.
+
+        Returns a dict of device_id -> state, or the raised exception for devices that failed.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(device: GoveeDevice):
+            async with semaphore:
+                try:
+                    return device.device_id, await self.get_device_state(device)
+                except Exception as e:
+                    return device.device_id, e
+
+        return dict(await asyncio.gather(*(fetch(device) for device in devices)))
+
     async def control_device(self, device: GoveeDevice, capability_type: str, instance: str, value: Any) -> bool:
-        _LOG.debug(f"Controlling device {device.device_id}: {capability_type}.{instance} = {value}")
+        _LOG.debug("Controlling device %s: %s.%s = %s", device.device_id, capability_type, instance, value)
         
         try:
-            command_data = {
-                "requestId": "uc_integration_request",
-                "payload": {
-                    "sku": device.sku,
-                    "device": device.device_id,
-                    "capability": {
-                        "type": capability_type,
-                        "instance": instance,
-                        "value": value
+            command_data = device._ctrl_template
+            if command_data is None:
+                command_data = device._ctrl_template = {
+                    "requestId": None,
+                    "payload": {
+                        "sku": device.sku,
+                        "device": device.device_id,
+                        "capability": None
                     }
                 }
+            command_data["requestId"] = uuid.uuid4().hex
+            command_data["payload"]["capability"] = {
+                "type": capability_type,
+                "instance": instance,
+                "value": value
             }
+            # Serialize right away: the template is shared by concurrent commands
+            body = orjson.dumps(command_data)
             
-            _LOG.debug(f"Sending command: {command_data}")
-            await self._make_request("POST", "/router/api/v1/device/control", command_data)
-            _LOG.debug(f"Successfully sent command to {device.device_id}")
+            _LOG.debug("Sending command: %s", command_data)
+            await self._make_request("POST", "/router/api/v1/device/control", body=body)
+            _LOG.debug("Successfully sent command to %s", device.device_id)
             return True
             
         except GoveeAPIError as e:
-            _LOG.error(f"Failed to control device {device.device_id}: {e}")
+            _LOG.error("Failed to control device %s: %s", device.device_id, e)
             return False
         except Exception as e:
-            _LOG.error(f"Unexpected error controlling device: {e}")
+            _LOG.error("Unexpected error controlling device: %s", e)
             return False
 
     async def turn_on(self, device: GoveeDevice) -> bool:
@@ -405,22 +634,22 @@ class GoveeClient:
         return await self.control_device(device, "devices.capabilities.on_off", "powerSwitch", 0)
 
     async def set_brightness(self, device: GoveeDevice, brightness: int) -> bool:
-        min_val, max_val = device.get_brightness_range()
-        brightness = max(min_val, min(max_val, brightness))
+        min_val, max_val = device.brightness_range
+        brightness = _clamp(brightness, min_val, max_val)
         return await self.control_device(device, "devices.capabilities.range", "brightness", brightness)
 
     async def set_color_rgb(self, device: GoveeDevice, rgb: int) -> bool:
-        rgb = max(0, min(16777215, rgb))
+        rgb = _clamp(rgb, 0, 16777215)
         return await self.control_device(device, "devices.capabilities.color_setting", "colorRgb", rgb)
 
     async def set_color_temperature(self, device: GoveeDevice, kelvin: int) -> bool:
-        min_val, max_val = device.get_color_temp_range()
-        kelvin = max(min_val, min(max_val, kelvin))
+        min_val, max_val = device.color_temp_range
+        kelvin = _clamp(kelvin, min_val, max_val)
         return await self.control_device(device, "devices.capabilities.color_setting", "colorTemperatureK", kelvin)
 
     async def set_temperature(self, device: GoveeDevice, temperature: int) -> bool:
-        min_val, max_val = device.get_temperature_range()
-        temperature = max(min_val, min(max_val, temperature))
+        min_val, max_val = device.temperature_range
+        temperature = _clamp(temperature, min_val, max_val)
         
         return await self.control_device(
             device, 
@@ -449,13 +678,17 @@ class GoveeClient:
             {"musicMode": mode, "sensitivity": sensitivity, "autoColor": 1}
         )
 
+    async def check_connection(self) -> None:
+        """Probe the API, raising GoveeAPIError (with the HTTP/API code when known) on failure."""
+        await self._make_request("GET", "/router/api/v1/user/devices")
+
     async def test_connection(self) -> bool:
         try:
-            response = await self._make_request("GET", "/router/api/v1/user/devices")
+            await self.check_connection()
             return True
         except GoveeAPIError as e:
-            _LOG.error(f"Connection test failed: {e}")
+            _LOG.error("Connection test failed: %s", e)
             return False
         except Exception as e:
-            _LOG.error(f"Unexpected error in connection test: {e}")
+            _LOG.error("Unexpected error in connection test: %s", e)
             return False
\ No newline at end of file
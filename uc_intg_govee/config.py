@@ -5,9 +5,13 @@ Configuration management for Govee integration.
 :license: MPL-2.0, see LICENSE for more details.
 """
 
-import json
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import orjson
 
 _LOG = logging.getLogger(__name__)
 
@@ -15,39 +19,119 @@ _LOG = logging.getLogger(__name__)
 class GoveeConfig:
     """Configuration management for Govee integration."""
     
+    # Setters within this many seconds of each other are coalesced into one write
+    SAVE_DELAY = 0.5
+    
     def __init__(self, config_file_path: str):
         self._config_file_path = config_file_path
         self._config_data: Dict[str, Any] = {}
+        self._dirty = False
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        self._write_future: Optional[asyncio.Future] = None
+        # Writes can come from the loop thread and the executor at once; the lock
+        # serializes them and the generations keep an older snapshot from landing last
+        self._write_lock = threading.Lock()
+        self._snapshot_generation = 0
+        self._written_generation = 0
+        # is_configured() result, reset whenever the API key can change
+        self._configured_cache: Optional[bool] = None
+        self._listeners: Dict[str, List[Callable[[Any], None]]] = {}
         self._load_config()
     
     def _load_config(self) -> None:
+        self._configured_cache = None
         try:
-            with open(self._config_file_path, 'r', encoding='utf-8') as f:
-                self._config_data = json.load(f)
+            with open(self._config_file_path, 'rb') as f:
+                self._config_data = orjson.loads(f.read())
             _LOG.debug("Configuration loaded successfully")
         except FileNotFoundError:
             _LOG.debug("Configuration file not found, starting with empty config")
             self._config_data = {}
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             _LOG.error("Error parsing configuration file: %s", e)
             self._config_data = {}
         except Exception as e:
             _LOG.error("Error loading configuration: %s", e)
             self._config_data = {}
     
+    def _serialize(self) -> Tuple[int, bytes]:
+        """Snapshot the config as (generation, JSON bytes); later snapshots get higher generations."""
+        self._snapshot_generation += 1
+        # Compact output: device capability blobs make an indented config several times larger
+        return self._snapshot_generation, orjson.dumps(self._config_data)
+    
+    def _write_file(self, generation: int, content: bytes) -> bool:
+        with self._write_lock:
+            if generation < self._written_generation:
+                # A newer snapshot is already on disk
+                return True
+            try:
+                # Write a temporary file and swap it in, so a crash never leaves a truncated config
+                temp_path = self._config_file_path + ".tmp"
+                with open(temp_path, 'wb') as f:
+                    f.write(content)
+                os.replace(temp_path, self._config_file_path)
+                self._written_generation = generation
+                _LOG.debug("Configuration saved successfully")
+                return True
+            except Exception as e:
+                _LOG.error("Error saving configuration: %s", e)
+                return False
+    
     def _save_config(self) -> bool:
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+        self._dirty = False
+        return self._write_file(*self._serialize())
+    
+    def _schedule_save(self) -> None:
+        """Mark the config dirty and write it once after SAVE_DELAY.
+
+        Outside a running event loop the config is written immediately.
+        """
+        self._dirty = True
         try:
-            with open(self._config_file_path, 'w', encoding='utf-8') as f:
-                json.dump(self._config_data, f, indent=2, ensure_ascii=False)
-            _LOG.debug("Configuration saved successfully")
-            return True
-        except Exception as e:
-            _LOG.error("Error saving configuration: %s", e)
-            return False
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._save_config()
+            return
+        if self._save_handle is None:
+            self._save_handle = loop.call_later(self.SAVE_DELAY, self._flush_pending, loop)
+    
+    def _flush_pending(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._save_handle = None
+        if not self._dirty:
+            return
+        if self._write_future is not None and not self._write_future.done():
+            # Keep writes ordered: wait for the previous one before starting another
+            self._save_handle = loop.call_later(self.SAVE_DELAY, self._flush_pending, loop)
+            return
+        self._dirty = False
+        # Snapshot on the loop thread, write to disk in the default executor
+        self._write_future = loop.run_in_executor(None, self._write_file, *self._serialize())
+    
+    def flush(self) -> None:
+        """Write pending changes to disk now, if there are any."""
+        if self._dirty:
+            self._save_config()
+    
+    def add_listener(self, key: str, callback: Callable[[Any], None]) -> None:
+        """Call callback with the new value whenever the given config key changes."""
+        self._listeners.setdefault(key, []).append(callback)
+    
+    def _notify(self, key: str, value: Any) -> None:
+        for callback in self._listeners.get(key, ()):
+            try:
+                callback(value)
+            except Exception as e:
+                _LOG.error("Error in config listener for %s: %s", key, e)
     
     def is_configured(self) -> bool:
-        api_key = self.api_key
-        return api_key is not None and api_key.strip() != ""
+        if self._configured_cache is None:
+            api_key = self.api_key
+            self._configured_cache = api_key is not None and api_key.strip() != ""
+        return self._configured_cache
     
     @property
     def api_key(self) -> Optional[str]:
@@ -56,7 +140,9 @@ class GoveeConfig:
     @api_key.setter
     def api_key(self, value: str) -> None:
         self._config_data["api_key"] = value.strip()
-        self._save_config()
+        self._configured_cache = None
+        self._schedule_save()
+        self._notify("api_key", self._config_data["api_key"])
 
     @property
     def devices(self) -> Dict[str, Any]:
@@ -65,20 +151,30 @@ class GoveeConfig:
     @devices.setter
     def devices(self, value: Dict[str, Any]) -> None:
         self._config_data["devices"] = value
-        self._save_config()
+        self._schedule_save()
+
+    @property
+    def last_test_ts(self) -> float:
+        """Wall-clock time of the last successful API connection test, 0 if never."""
+        return self._config_data.get("last_test_ts", 0.0)
+
+    @last_test_ts.setter
+    def last_test_ts(self, value: float) -> None:
+        self._config_data["last_test_ts"] = value
+        self._schedule_save()
 
     def get_device_config(self, device_id: str) -> Dict[str, Any]:
         return self.devices.get(device_id, {})
 
     def set_device_config(self, device_id: str, config: Dict[str, Any]) -> None:
-        devices = self.devices.copy()
-        devices[device_id] = config
-        self.devices = devices
+        self._config_data.setdefault("devices", {})[device_id] = config
+        self._schedule_save()
 
     def get_polling_interval(self) -> int:
         return self._config_data.get("polling_interval", 30)
     
     def set_polling_interval(self, interval: int) -> bool:
+        """Set the polling interval, clamped to 10-300 s, and save now; returns whether the write succeeded."""
         try:
             self._config_data["polling_interval"] = max(10, min(300, interval))
             return self._save_config()
@@ -94,7 +190,21 @@ class GoveeConfig:
 
     def clear(self) -> None:
         self._config_data = {}
-        self._save_config()
+        self._configured_cache = None
+        self._schedule_save()
+        self._notify("api_key", "")
 
     def save(self) -> None:
-        self._save_config()
\ No newline at end of file
+        self._save_config()
+
+    async def save_async(self) -> bool:
+        """Write the config now without blocking the event loop."""
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+        self._dirty = False
+        if self._write_future is not None and not self._write_future.done():
+            await self._write_future
+        loop = asyncio.get_running_loop()
+        self._write_future = loop.run_in_executor(None, self._write_file, *self._serialize())
+        return await self._write_future
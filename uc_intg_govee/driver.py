@@ -6,27 +6,28 @@ Govee integration driver for Unfolded Circle Remote.
 :license: MPL-2.0, see LICENSE for more details.
 """
 import asyncio
+import functools
 import logging
 import os
+import random
 import signal
 from typing import Optional
 
 import ucapi
 
-from uc_intg_govee.client import GoveeClient
+from uc_intg_govee.client import GoveeAPIError, GoveeClient
 from uc_intg_govee.config import GoveeConfig
 from uc_intg_govee.remote import GoveeRemote
 from uc_intg_govee.setup import GoveeSetup
 
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s | %(levelname)8s | %(name)s | %(message)s"
+    format="%(asctime)s | %(levelname).1s | %(name)s | %(message)s"
 )
 logging.getLogger("aiohttp").setLevel(logging.WARNING)
 
 _LOG = logging.getLogger(__name__)
 
-loop = asyncio.get_event_loop()
 api: Optional[ucapi.IntegrationAPI] = None
 govee_client: Optional[GoveeClient] = None
 govee_config: Optional[GoveeConfig] = None
@@ -38,13 +39,79 @@ remote: Optional[GoveeRemote] = None
 # Track whether entities have been created to handle UC Remote subscription
 # attempts that occur before entity creation completes
 entities_initialized = False
-initialization_lock = asyncio.Lock()
+initialization_lock: Optional[asyncio.Lock] = None
+_shutdown_event: Optional[asyncio.Event] = None
 # ============================================================================
 
+def _get_init_lock() -> asyncio.Lock:
+    """Create the initialization lock on first use, inside the running loop."""
+    global initialization_lock
+    if initialization_lock is None:
+        initialization_lock = asyncio.Lock()
+    return initialization_lock
+
+CONNECT_MAX_RETRIES = 5
+CONNECT_BASE_DELAY = 1.0
+CONNECT_MAX_DELAY = 30.0
+
+# A successful probe is reused for this long so back-to-back connect/subscribe
+# events don't each pay an HTTPS round trip; failures are never cached
+PROBE_CACHE_TTL = 30.0
+_last_probe_ts: Optional[float] = None
+_probe_task: Optional[asyncio.Task] = None
+_last_known_state: Optional[ucapi.DeviceStates] = None
+
+_background_tasks: set = set()
+
+def _spawn(coro) -> asyncio.Task:
+    """Run coro in the background, keeping a reference until it finishes."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+async def _set_device_state(state: ucapi.DeviceStates):
+    """Set the integration device state, remembering it for the event handlers."""
+    global _last_known_state
+    _last_known_state = state
+    await api.set_device_state(state)
+
+def _probe_is_fresh(ttl: float = PROBE_CACHE_TTL) -> bool:
+    return _last_probe_ts is not None and asyncio.get_running_loop().time() - _last_probe_ts < ttl
+
+def _record_probe_success():
+    global _last_probe_ts
+    _last_probe_ts = asyncio.get_running_loop().time()
+
+async def _probe_connection() -> bool:
+    global _last_probe_ts
+    
+    if await govee_client.test_connection():
+        _record_probe_success()
+        return True
+    
+    _last_probe_ts = None
+    return False
+
+async def _cached_test_connection(ttl: float = PROBE_CACHE_TTL) -> bool:
+    """Return True if the Govee API was reachable within ttl seconds, probing otherwise.
+
+    Concurrent callers share a single in-flight probe.
+    """
+    global _probe_task
+    
+    if _probe_is_fresh(ttl):
+        return True
+    
+    if _probe_task is None or _probe_task.done():
+        _probe_task = asyncio.create_task(_probe_connection())
+    # Shield so one caller being cancelled doesn't cancel the probe for the others
+    return await asyncio.shield(_probe_task)
+
 async def create_entities_from_config():
-    global remote, entities_initialized, initialization_lock
+    global remote, entities_initialized
     
-    async with initialization_lock:
+    async with _get_init_lock():
         if entities_initialized:
             _LOG.debug("Entities already initialized, skipping duplicate creation")
             return
@@ -59,87 +126,121 @@ async def create_entities_from_config():
             return
         
         try:
-            _LOG.info(f"PRE-CREATING entities for {len(discovered_devices)} devices to prevent race condition")
+            _LOG.info("PRE-CREATING entities for %s devices to prevent race condition", len(discovered_devices))
             
-            for device_id, device_info in discovered_devices.items():
-                _LOG.debug(f"Device {device_id}: {device_info.get('name')} ({device_info.get('type')}) - SKU: {device_info.get('sku')}")
+            if _LOG.isEnabledFor(logging.DEBUG):
+                for device_id, device_info in discovered_devices.items():
+                    _LOG.debug("Device %s: %s (%s) - SKU: %s", device_id, device_info.get('name'), device_info.get('type'), device_info.get('sku'))
             
             remote = GoveeRemote(api, govee_client, govee_config)
             api.available_entities.add(remote.entity)
-            _LOG.info(f"Pre-created remote entity: {remote.entity.id}")
+            _LOG.info("Pre-created remote entity: %s", remote.entity.id)
             
             entities_initialized = True
             _LOG.info("Entities initialized and ready for subscription")
             
         except Exception as e:
-            _LOG.error(f"Error pre-creating entities: {e}", exc_info=True)
+            _LOG.error("Error pre-creating entities: %s", e, exc_info=True)
             entities_initialized = False
 
+async def _discard_remote() -> bool:
+    """Drop the remote built from the previous device config so the next creation rebuilds it.
+    
+    Returns whether the old remote entity was configured on the Remote.
+    """
+    global remote, entities_initialized
+    
+    async with _get_init_lock():
+        if remote is None:
+            return False
+        
+        entity_id = remote.entity.id
+        was_configured = api.configured_entities.contains(entity_id)
+        api.available_entities.remove(entity_id)
+        api.configured_entities.remove(entity_id)
+        remote = None
+        entities_initialized = False
+        return was_configured
+
 async def verify_and_set_connection_state():
     if not govee_config or not govee_config.is_configured():
         _LOG.warning("Integration is not configured")
-        await api.set_device_state(ucapi.DeviceStates.ERROR)
+        await _set_device_state(ucapi.DeviceStates.ERROR)
         return
     
-    govee_client._api_key = govee_config.api_key
-    govee_client._headers["Govee-API-Key"] = govee_config.api_key
-    
-    # Retry logic for connection verification
-    max_retries = 5
-    retry_delays = [2, 4, 8, 16, 32]
+    # Retry logic for connection verification: exponential backoff with +/-50% jitter
+    # so several remotes restarting together don't retry in lockstep
+    max_retries = CONNECT_MAX_RETRIES
     connection_successful = False
     
     for attempt in range(max_retries):
         if attempt > 0:
-            delay = retry_delays[attempt - 1]
-            _LOG.warning(f"Connection attempt {attempt + 1}/{max_retries} - waiting {delay}s for network stabilization...")
+            delay = min(CONNECT_MAX_DELAY, CONNECT_BASE_DELAY * 2 ** attempt) * (1 + random.uniform(-0.5, 0.5))
+            _LOG.warning("Connection attempt %s/%s - waiting %.1fs for network stabilization...", attempt + 1, max_retries, delay)
             await asyncio.sleep(delay)
         else:
-            _LOG.info(f"Connection attempt {attempt + 1}/{max_retries}")
+            _LOG.info("Connection attempt %s/%s", attempt + 1, max_retries)
         
         try:
-            if await govee_client.test_connection():
-                _LOG.info(f"Govee connection successful on attempt {attempt + 1}/{max_retries}")
-                connection_successful = True
+            await govee_client.check_connection()
+            _record_probe_success()
+            _LOG.info("Govee connection successful on attempt %s/%s", attempt + 1, max_retries)
+            connection_successful = True
+            break
+        
+        except GoveeAPIError as e:
+            if e.code is not None and 400 <= e.code < 500 and e.code != 429:
+                # Bad API key or request - retrying will not help
+                _LOG.error("Govee connection failed with unrecoverable error: %s", e)
                 break
-            else:
-                _LOG.warning(f"Govee connection failed on attempt {attempt + 1}/{max_retries}")
-                
+            _LOG.warning("Govee connection failed on attempt %s/%s: %s", attempt + 1, max_retries, e)
         except Exception as e:
-            _LOG.warning(f"Connection attempt {attempt + 1}/{max_retries} raised exception: {e}")
+            _LOG.warning("Connection attempt %s/%s raised exception: %s", attempt + 1, max_retries, e)
     
     # Set device state based on connection result
     if connection_successful:
         _LOG.info("Govee API connection verified. Setting state to CONNECTED.")
-        await api.set_device_state(ucapi.DeviceStates.CONNECTED)
+        await _set_device_state(ucapi.DeviceStates.CONNECTED)
     else:
-        _LOG.error(f"Cannot connect to Govee API after {max_retries} attempts")
+        _LOG.error("Cannot connect to Govee API")
         _LOG.error("Entities are available but connection to Govee API failed")
-        await api.set_device_state(ucapi.DeviceStates.ERROR)
+        await _set_device_state(ucapi.DeviceStates.ERROR)
 
 async def on_setup_complete():
-    global entities_initialized
-    
     _LOG.info("Setup complete. Creating entities...")
     
     if not api or not govee_client:
         _LOG.error("Cannot create entities: API or client not initialized.")
-        await api.set_device_state(ucapi.DeviceStates.ERROR)
+        await _set_device_state(ucapi.DeviceStates.ERROR)
         return
     
+    # The connection probe doesn't depend on the entities, so overlap it with their creation
+    probe_task = asyncio.create_task(_cached_test_connection())
+    
+    # Setup may have rediscovered devices: rebuild the remote so its layout, command
+    # routing and device wrappers all come from the new config
+    was_configured = await _discard_remote()
+    
     # Use the same entity creation logic
     await create_entities_from_config()
     
+    if was_configured and remote:
+        api.configured_entities.add(remote.entity)
+        _spawn(remote.push_initial_state())
+    
     if entities_initialized:
-        # Verify connection after entities are created
-        await verify_and_set_connection_state()
+        if await probe_task:
+            _LOG.info("Govee API connection verified. Setting state to CONNECTED.")
+            await _set_device_state(ucapi.DeviceStates.CONNECTED)
+        else:
+            # Fall back to the retrying verification in the background so setup completes now
+            _spawn(verify_and_set_connection_state())
     else:
-        await api.set_device_state(ucapi.DeviceStates.ERROR)
+        probe_task.cancel()
+        await _set_device_state(ucapi.DeviceStates.ERROR)
 
 async def on_r2_connect():
     """Handle Remote connection."""
-    global entities_initialized
-    
     _LOG.info("Remote connected.")
     
     # Ensure entities are created before UC Remote tries to use them
@@ -150,12 +251,12 @@ async def on_r2_connect():
         
         # Verify connection if entities are ready
         if entities_initialized and govee_client:
-            if await govee_client.test_connection():
+            if await _cached_test_connection():
                 _LOG.info("Govee connection verified. Setting state to CONNECTED.")
-                await api.set_device_state(ucapi.DeviceStates.CONNECTED)
+                await _set_device_state(ucapi.DeviceStates.CONNECTED)
             else:
                 _LOG.warning("Govee connection failed. Setting state to ERROR.")
-                await api.set_device_state(ucapi.DeviceStates.ERROR)
+                await _set_device_state(ucapi.DeviceStates.ERROR)
     else:
         _LOG.info("Integration not configured yet.")
 
@@ -163,63 +264,87 @@ async def on_disconnect():
     """Handle Remote disconnection."""
     _LOG.info("Remote disconnected.")
 
+def _entities_for_ids(entity_ids: list[str]) -> list:
+    """Return the driver's entity wrappers whose entity id is in entity_ids."""
+    return [entity for entity in (remote,) if entity and entity.entity.id in entity_ids]
+
 async def on_subscribe_entities(entity_ids: list[str]):
     """Handle entity subscription."""
-    global entities_initialized
-    
-    _LOG.info(f"Entities subscribed: {entity_ids}. Pushing initial state.")
+    _LOG.info("Entities subscribed: %s. Pushing initial state.", entity_ids)
     
     # Guard against race condition - ensure entities exist before subscription
     if not entities_initialized:
         _LOG.warning("RACE CONDITION DETECTED: Subscription requested before entities ready!")
         await create_entities_from_config()
     
-    if remote and govee_client and govee_config.is_configured():
+    if _last_known_state == ucapi.DeviceStates.CONNECTED and _probe_is_fresh():
+        _LOG.debug("Govee connection verified recently, skipping connection test")
+    elif remote and govee_client and govee_config.is_configured():
         _LOG.info("Ensuring remote entity has configured Govee client...")
         
-        connection_ok = await govee_client.test_connection()
-        _LOG.info(f"Govee client connection test: {'OK' if connection_ok else 'FAILED'}")
+        connection_ok = await _cached_test_connection()
+        _LOG.info("Govee client connection test: %s", 'OK' if connection_ok else 'FAILED')
         
         if not connection_ok:
             _LOG.error("Govee client connection failed during entity subscription")
-            await api.set_device_state(ucapi.DeviceStates.ERROR)
+            await _set_device_state(ucapi.DeviceStates.ERROR)
             return
     
-    if remote and remote.entity.id in entity_ids:
-        _LOG.info("Remote entity subscribed - pushing initial state")
-        await remote.push_initial_state()
-        _LOG.info("Remote entity fully initialized and ready for commands")
+    entities = _entities_for_ids(entity_ids)
+    if entities:
+        _LOG.info("Entities subscribed - pushing initial state")
+        results = await asyncio.gather(*(entity.push_initial_state() for entity in entities), return_exceptions=True)
+        for entity, result in zip(entities, results):
+            if isinstance(result, Exception):
+                _LOG.error("Failed to push initial state for %s: %s", entity.entity.id, result)
+        _LOG.info("Entities fully initialized and ready for commands")
+        
+        if remote in entities:
+            # Warm the remote's power-state cache so the first toggles go the right way
+            _spawn(remote.refresh_all_states())
 
 async def on_unsubscribe_entities(entity_ids: list[str]):
     """Handle entity unsubscription from Remote."""
-    _LOG.info(f"Remote unsubscribed from entities: {entity_ids}")
+    _LOG.info("Remote unsubscribed from entities: %s", entity_ids)
     
     if remote and remote.entity.id in entity_ids:
         _LOG.info("Remote entity unsubscribed")
 
-async def init_integration():
-    """Initialize the integration objects and API."""
-    global api, govee_client, govee_config
-    
+@functools.lru_cache(maxsize=None)
+def _resolve_driver_json() -> str:
+    """Locate driver.json once per process (project root first, then the working directory)."""
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    driver_json_path = os.path.join(project_root, "driver.json")
     
-    if not os.path.exists(driver_json_path):
-        driver_json_path = "driver.json"
-        if not os.path.exists(driver_json_path):
-            _LOG.error(f"Cannot find driver.json at {driver_json_path}")
-            raise FileNotFoundError("driver.json not found")
+    # Opening is one syscall per candidate; exists() + the later open would be two
+    for driver_json_path in (os.path.join(project_root, "driver.json"), "driver.json"):
+        try:
+            with open(driver_json_path, "rb"):
+                return driver_json_path
+        except FileNotFoundError:
+            continue
     
-    _LOG.info(f"Using driver.json from: {driver_json_path}")
+    _LOG.error("Cannot find driver.json at %s", driver_json_path)
+    raise FileNotFoundError("driver.json not found")
+
+async def init_integration(loop: asyncio.AbstractEventLoop):
+    """Initialize the integration objects and API."""
+    global api, govee_client, govee_config
+    
+    driver_json_path = _resolve_driver_json()
+    _LOG.info("Using driver.json from: %s", driver_json_path)
 
     api = ucapi.IntegrationAPI(loop)
 
     config_path = os.path.join(api.config_dir_path, "config.json")
-    _LOG.info(f"Using config file: {config_path}")
+    _LOG.info("Using config file: %s", config_path)
     govee_config = GoveeConfig(config_path)
     
-    govee_client = GoveeClient("")
+    govee_client = GoveeClient(govee_config.api_key or "")
     govee_client._config = govee_config
+    # Keep the client's API key in step with the saved configuration
+    govee_config.add_listener("api_key", govee_client.set_api_key)
+    # One long-lived session (and keep-alive pool) serves every request until shutdown
+    await govee_client.connect()
 
     setup_handler = GoveeSetup(govee_config, govee_client, on_setup_complete)
     
@@ -234,10 +359,17 @@ async def init_integration():
     
 async def main():
     """Main entry point."""
+    global _shutdown_event
+    
     _LOG.info("Starting Govee Integration Driver")
     
+    loop = asyncio.get_running_loop()
+    _shutdown_event = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, shutdown_handler, sig)
+    
     try:
-        await init_integration()
+        await init_integration(loop)
         if govee_config and govee_config.is_configured():
             _LOG.info("Integration is already configured - pre-creating entities")
             
@@ -248,58 +380,60 @@ async def main():
                 _LOG.info("Entities created successfully - now safe for UC Remote subscription")
                 
                 # Step 2: Verify connection in background (doesn't block entity availability)
-                loop.create_task(verify_and_set_connection_state())
+                _spawn(verify_and_set_connection_state())
             else:
                 _LOG.error("Failed to create entities from configuration")
-                await api.set_device_state(ucapi.DeviceStates.ERROR)
+                await _set_device_state(ucapi.DeviceStates.ERROR)
         else:
             _LOG.warning("Integration is not configured. Waiting for setup...")
-            await api.set_device_state(ucapi.DeviceStates.ERROR)
+            await _set_device_state(ucapi.DeviceStates.ERROR)
 
         _LOG.info("Integration is running. Press Ctrl+C to stop.")
         
     except Exception as e:
-        _LOG.error(f"Failed to start integration: {e}", exc_info=True)
+        _LOG.error("Failed to start integration: %s", e, exc_info=True)
         if api:
-            await api.set_device_state(ucapi.DeviceStates.ERROR)
+            await _set_device_state(ucapi.DeviceStates.ERROR)
         raise
     
-def shutdown_handler(signum, frame):
+    await _shutdown_event.wait()
+    await cleanup()
+
+def shutdown_handler(signum):
     """Handle termination signals for graceful shutdown."""
-    _LOG.warning(f"Received signal {signum}. Shutting down...")
-    
-    async def cleanup():
-        try:
-            if govee_client:
-                _LOG.info("Closing Govee client...")
-                await govee_client.disconnect()
-            
-            _LOG.info("Cancelling remaining tasks...")
-            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
-            [task.cancel() for task in tasks]
-            
-            await asyncio.gather(*tasks, return_exceptions=True)
-            
-        except Exception as e:
-            _LOG.error(f"Error during cleanup: {e}")
-        finally:
-            _LOG.info("Stopping event loop...")
-            loop.stop()
+    _LOG.warning("Received signal %s. Shutting down...", signum)
+    _shutdown_event.set()
 
-    loop.create_task(cleanup())
+async def cleanup():
+    """Write pending config changes, close the Govee client and cancel remaining tasks."""
+    try:
+        if govee_config:
+            # Config setters debounce their writes; don't lose one made just before shutdown
+            govee_config.flush()
+        
+        if govee_client:
+            _LOG.info("Closing Govee client...")
+            try:
+                # Don't let a hung HTTPS close hold up SIGTERM handling
+                await asyncio.wait_for(govee_client.disconnect(), timeout=2.0)
+            except asyncio.TimeoutError:
+                _LOG.warning("Timed out closing Govee client")
+        
+        _LOG.info("Cancelling remaining tasks...")
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        
+        if tasks:
+            await asyncio.wait(tasks, timeout=5.0)
+        
+    except Exception as e:
+        _LOG.error("Error during cleanup: %s", e)
 
 if __name__ == "__main__":
-    signal.signal(signal.SIGINT, shutdown_handler)
-    signal.signal(signal.SIGTERM, shutdown_handler)
-
     try:
-        loop.run_until_complete(main())
-        loop.run_forever()
+        asyncio.run(main())
     except (KeyboardInterrupt, asyncio.CancelledError):
         _LOG.info("Driver stopped.")
     except Exception as e:
-        _LOG.error(f"Driver failed: {e}", exc_info=True)
-    finally:
-        if loop and not loop.is_closed():
-            _LOG.info("Closing event loop...")
-            loop.close()
\ No newline at end of file
+        _LOG.error("Driver failed: %s", e, exc_info=True)
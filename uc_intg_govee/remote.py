@@ -6,108 +6,243 @@ Govee remote entity for Unfolded Circle integration.
 """
 
 import asyncio
+import functools
 import logging
-from typing import Any, Dict, List, Optional
+import re
+import time
+from itertools import islice, product
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import ucapi
 from ucapi.remote import Commands, Features, States
 from ucapi.ui import Buttons, Size, create_btn_mapping, create_ui_text, UiPage
 
-from uc_intg_govee.client import GoveeClient
+from uc_intg_govee.client import GoveeClient, GoveeDevice
 
 _LOG = logging.getLogger(__name__)
 
+_UNDERSCORE_RUNS = re.compile(r"_+")
 
-class GoveeRemote:
-    """Govee remote entity with scalable SKU-based UI organization."""
-    
-    def __init__(self, api: ucapi.IntegrationAPI, client: GoveeClient, config: 'GoveeConfig'):
-        self._api = api
-        self._client = client
-        self._config = config
-        self._device_throttle = {}
-        self._global_throttle = 0
-        self._device_states = {}
-        
-        self._discovered_devices = self._config.devices
-        _LOG.info(f"Creating remote with {len(self._discovered_devices)} discovered devices")
-        
-        features = [Features.ON_OFF, Features.SEND_CMD]
-        simple_commands = self._generate_simple_commands()
-        button_mapping = self._generate_button_mapping()
-        ui_pages = self._create_scalable_ui_pages()
-        
-        self.entity = ucapi.Remote(
-            identifier="govee_remote_main",
-            name={"en": "Govee Remote"},
-            features=features,
-            attributes={"state": States.ON},
-            simple_commands=simple_commands,
-            button_mapping=button_mapping,
-            ui_pages=ui_pages,
-            cmd_handler=self.cmd_handler
+# Cache-miss marker for lookups where None is a valid cached value
+_MISSING = object()
+
+# Device types in the order we prefer them for the hardware power button
+_PRIMARY_TYPE_RANK = {
+    device_type: rank
+    for rank, device_type in enumerate(
+        ("sync_box", "light", "kettle", "humidifier", "heater", "switch", "socket", "sensor")
+    )
+}
+
+# Per-device command suffixes for the fixed brightness, color and temperature presets
+_BRIGHTNESS_SUFFIXES = ("BRIGHTNESS_UP", "BRIGHTNESS_DOWN", "BRIGHTNESS_25", "BRIGHTNESS_50", "BRIGHTNESS_75", "BRIGHTNESS_100")
+_COLOR_SUFFIXES = ("COLOR_RED", "COLOR_GREEN", "COLOR_BLUE", "COLOR_WHITE", "COLOR_WARM", "COLOR_COOL")
+_TEMP_SUFFIXES = ("TEMP_UP", "TEMP_DOWN", "TEMP_60", "TEMP_70", "TEMP_80", "TEMP_90", "TEMP_100")
+# Assumed temperature range when a device config does not carry one
+_DEFAULT_TEMP_RANGE = (20, 100)
+
+# (label, command suffix) cells for the fixed one-row preset blocks on device pages
+_BRIGHTNESS_CELLS = (("25%", "BRIGHTNESS_25"), ("50%", "BRIGHTNESS_50"), ("75%", "BRIGHTNESS_75"), ("100%", "BRIGHTNESS_100"))
+_COLOR_CELLS = (("Red", "COLOR_RED"), ("Green", "COLOR_GREEN"), ("Blue", "COLOR_BLUE"), ("White", "COLOR_WHITE"))
+_KETTLE_TEMP_CELLS = tuple((f"{temp}°", f"TEMP_{temp}") for temp in (60, 70, 80, 90))
+_ROOM_TEMP_CELLS = tuple((f"{temp}°", f"TEMP_{temp}") for temp in (20, 25, 30, 35))
+
+# Shared item and grid sizes; every page uses the remote's 4x6 grid
+_SIZE_1X1 = Size(1, 1)
+_SIZE_2X1 = Size(2, 1)
+_SIZE_4X1 = Size(4, 1)
+_GRID_COLUMNS = 4
+_GRID_ROWS = 6
+_GRID_SIZE = Size(_GRID_COLUMNS, _GRID_ROWS)
+
+# Color preset name -> packed RGB value sent by the color_* actions
+_COLOR_MAP = {
+    "red": 16711680, "green": 65280, "blue": 255, "white": 16777215,
+    "warm": 16753920, "cool": 11593983
+}
+
+# Fallback workMode values for kettles whose work modes weren't discovered
+_KETTLE_MODE_MAP = {"diy": 1, "tea": 2, "coffee": 3, "boiling": 4}
+
+# Capability carrying a device's power state in the state response
+_ON_OFF_TYPE = "devices.capabilities.on_off"
+_POWER_INSTANCE = "powerSwitch"
+
+# ALL_* command suffix -> per-device action, shared by global and SKU group commands
+_ALL_ACTION = {"ALL_ON": "turn_on", "ALL_OFF": "turn_off", "ALL_TOGGLE": "toggle"}
+
+_MODE_TOKEN_TABLE = str.maketrans(" ", "_")
+_SCENE_TOKEN_TABLE = str.maketrans({" ": "_", "'": None})
+
+
+@functools.lru_cache(maxsize=512)
+def _command_token(name: str, strip_quotes: bool = False) -> str:
+    """Upper-case a mode or scene name into its command suffix, e.g. "Green Tea" -> "GREEN_TEA"."""
+    return name.upper().translate(_SCENE_TOKEN_TABLE if strip_quotes else _MODE_TOKEN_TABLE)
+
+
+# Capability bits, computed once per device from its supports_* flags
+_CAP_POWER = 1 << 0
+_CAP_DREAMVIEW = 1 << 1
+_CAP_GRADIENT = 1 << 2
+_CAP_MUSIC = 1 << 3
+_CAP_BRIGHTNESS = 1 << 4
+_CAP_COLOR = 1 << 5
+_CAP_TEMPERATURE = 1 << 6
+_CAP_WORK_MODE = 1 << 7
+_CAP_SCENES = 1 << 8
+
+_CAPABILITY_FLAGS = (
+    ("supports_power", _CAP_POWER),
+    ("supports_dreamview", _CAP_DREAMVIEW),
+    ("supports_gradient", _CAP_GRADIENT),
+    ("supports_music", _CAP_MUSIC),
+    ("supports_brightness", _CAP_BRIGHTNESS),
+    ("supports_color", _CAP_COLOR),
+    ("supports_temperature", _CAP_TEMPERATURE),
+    ("supports_work_mode", _CAP_WORK_MODE),
+    ("supports_scenes", _CAP_SCENES),
+)
+
+
+def _capability_mask(device_info: Dict[str, Any]) -> int:
+    """Fold a device's supports_* flags into a CAP_* bitmask."""
+    mask = 0
+    for key, bit in _CAPABILITY_FLAGS:
+        if device_info.get(key):
+            mask |= bit
+    return mask
+
+
+# UI action -> (required capability, client action) for every action with a fixed name
+_UI_ACTION_MAP: Dict[str, Tuple[int, str]] = {
+    "ON": (_CAP_POWER, "turn_on"),
+    "OFF": (_CAP_POWER, "turn_off"),
+    "TOGGLE": (_CAP_POWER, "toggle"),
+    "DREAMVIEW_ON": (_CAP_DREAMVIEW, "dreamview_on"),
+    "DREAMVIEW_OFF": (_CAP_DREAMVIEW, "dreamview_off"),
+    "GRADIENT_ON": (_CAP_GRADIENT, "gradient_on"),
+    "GRADIENT_OFF": (_CAP_GRADIENT, "gradient_off"),
+    "SENSITIVITY_UP": (_CAP_MUSIC, "sensitivity_up"),
+    "SENSITIVITY_DOWN": (_CAP_MUSIC, "sensitivity_down"),
+    **{
+        suffix: (capability, suffix.lower())
+        for suffixes, capability in (
+            (_BRIGHTNESS_SUFFIXES, _CAP_BRIGHTNESS),
+            (_COLOR_SUFFIXES, _CAP_COLOR),
+            (_TEMP_SUFFIXES, _CAP_TEMPERATURE),
         )
-        
-        _LOG.info(f"Govee remote entity created with {len(simple_commands)} commands and {len(ui_pages)} UI pages")
+        for suffix in suffixes
+    },
+}
+
+# Leading token -> required capability for families that accept any suffix (mode and scene
+# names come from the device). Those actions map to their lower-cased name.
+_OPEN_UI_ACTION_FAMILIES = {
+    "MUSIC": _CAP_MUSIC,
+    "COLOR": _CAP_COLOR,
+    "TEMP": _CAP_TEMPERATURE,
+    "MODE": _CAP_WORK_MODE,
+    "SCENE": _CAP_SCENES,
+}
+
+def _bounded_put(cache: Dict[Any, Any], key: Any, value: Any, maxsize: int) -> None:
+    """Store a memo entry, evicting the oldest entry once the cache holds maxsize of them."""
+    if len(cache) >= maxsize:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+def _numeric_suffix(action: str, default: int) -> int:
+    """Parse the number after the last underscore, e.g. brightness_75 -> 75."""
+    try:
+        return int(action.rsplit("_", 1)[1])
+    except (IndexError, ValueError):
+        return default
+
+
+def _find_by_name(device_info: Dict[str, Any], list_key: str, index_key: str, name: str) -> Optional[Tuple[str, Any]]:
+    """Find a mode or scene by lower-cased name and return its (instance, value).
+    
+    Uses the name index setup stores with each device, and falls back to scanning the list
+    for configs saved before the index existed.
+    """
+    index = device_info.get(index_key)
+    if index is not None:
+        return index.get(name)
+    for entry in device_info.get(list_key, ()):
+        if (entry.get("name") or "").lower() == name:
+            return entry.get("instance", ""), entry.get("value", 1)
+    return None
+
+
+class _RemoteLayout:
+    """Builds the remote's commands and UI pages from the discovered devices."""
+    
+    def __init__(self, devices: Dict[str, Any]):
+        self._discovered_devices = devices
+        # Display name per device, with the fallback for unnamed devices applied once
+        self._names: Dict[str, str] = {
+            device_id: device_info.get("name") or f"Device {device_id}" for device_id, device_info in devices.items()
+        }
+        self._caps: Dict[str, int] = {
+            device_id: _capability_mask(device_info) for device_id, device_info in devices.items()
+        }
+        self._sku_groups: Optional[Dict[str, Dict[str, Any]]] = None
     
     def _generate_simple_commands(self) -> List[str]:
-        commands = []
+        commands: set[str] = set()
         
         if not self._discovered_devices:
             return ["NO_DEVICES"]
         
         # Generate per-device commands
         for device_id, device_info in self._discovered_devices.items():
-            device_name = device_info.get("name", f"Device_{device_id}")
+            device_name = self._names[device_id]
             clean_name = self._clean_command_name(device_name)
+            caps = self._caps[device_id]
             
-            if device_info.get("supports_power"):
-                commands.extend([f"{clean_name}_ON", f"{clean_name}_OFF", f"{clean_name}_TOGGLE"])
+            if caps & _CAP_POWER:
+                commands.update(f"{clean_name}_{suffix}" for suffix in ("ON", "OFF", "TOGGLE"))
             
             if device_info.get("type") == "sync_box":
-                if device_info.get("supports_dreamview"):
-                    commands.extend([f"{clean_name}_DREAMVIEW_ON", f"{clean_name}_DREAMVIEW_OFF"])
-                if device_info.get("supports_gradient"):
-                    commands.extend([f"{clean_name}_GRADIENT_ON", f"{clean_name}_GRADIENT_OFF"])
-                if device_info.get("supports_music"):
+                if caps & _CAP_DREAMVIEW:
+                    commands.update(f"{clean_name}_{suffix}" for suffix in ("DREAMVIEW_ON", "DREAMVIEW_OFF"))
+                if caps & _CAP_GRADIENT:
+                    commands.update(f"{clean_name}_{suffix}" for suffix in ("GRADIENT_ON", "GRADIENT_OFF"))
+                if caps & _CAP_MUSIC:
                     music_modes = device_info.get("music_modes", [])
                     for mode in music_modes:
-                        mode_name = mode.get("name", "").upper().replace(" ", "_")
-                        commands.append(f"{clean_name}_MUSIC_{mode_name}")
-                    commands.extend([f"{clean_name}_SENSITIVITY_UP", f"{clean_name}_SENSITIVITY_DOWN"])
+                        mode_name = _command_token(mode.get("name", ""))
+                        commands.add(f"{clean_name}_MUSIC_{mode_name}")
+                    commands.update(f"{clean_name}_{suffix}" for suffix in ("SENSITIVITY_UP", "SENSITIVITY_DOWN"))
             
-            if device_info.get("supports_brightness"):
-                commands.extend([f"{clean_name}_BRIGHTNESS_UP", f"{clean_name}_BRIGHTNESS_DOWN", 
-                               f"{clean_name}_BRIGHTNESS_25", f"{clean_name}_BRIGHTNESS_50", 
-                               f"{clean_name}_BRIGHTNESS_75", f"{clean_name}_BRIGHTNESS_100"])
+            if caps & _CAP_BRIGHTNESS:
+                commands.update(f"{clean_name}_{suffix}" for suffix in _BRIGHTNESS_SUFFIXES)
             
-            if device_info.get("supports_color"):
-                commands.extend([f"{clean_name}_COLOR_RED", f"{clean_name}_COLOR_GREEN", 
-                               f"{clean_name}_COLOR_BLUE", f"{clean_name}_COLOR_WHITE",
-                               f"{clean_name}_COLOR_WARM", f"{clean_name}_COLOR_COOL"])
+            if caps & _CAP_COLOR:
+                commands.update(f"{clean_name}_{suffix}" for suffix in _COLOR_SUFFIXES)
             
-            if device_info.get("supports_temperature"):
-                commands.extend([f"{clean_name}_TEMP_UP", f"{clean_name}_TEMP_DOWN",
-                               f"{clean_name}_TEMP_60", f"{clean_name}_TEMP_70",
-                               f"{clean_name}_TEMP_80", f"{clean_name}_TEMP_90", f"{clean_name}_TEMP_100"])
+            if caps & _CAP_TEMPERATURE:
+                commands.update(f"{clean_name}_{suffix}" for suffix in _TEMP_SUFFIXES)
             
-            if device_info.get("supports_work_mode"):
+            if caps & _CAP_WORK_MODE:
                 work_modes = device_info.get("work_modes", [])
                 for mode in work_modes[:5]:
-                    mode_name = mode.get("name", "").upper().replace(" ", "_")
+                    mode_name = _command_token(mode.get("name", ""))
                     if mode_name:
-                        commands.append(f"{clean_name}_MODE_{mode_name}")
+                        commands.add(f"{clean_name}_MODE_{mode_name}")
             
-            if device_info.get("supports_scenes"):
+            if caps & _CAP_SCENES:
                 scenes = device_info.get("scenes", [])
                 for scene in scenes[:10]:
-                    scene_name = scene.get("name", "").upper().replace(" ", "_").replace("'", "")
+                    scene_name = _command_token(scene.get("name", ""), strip_quotes=True)
                     if scene_name:
-                        commands.append(f"{clean_name}_SCENE_{scene_name}")
+                        commands.add(f"{clean_name}_SCENE_{scene_name}")
         
         # Generate global ALL commands (for all devices)
         if len(self._discovered_devices) > 1:
-            commands.extend(["ALL_ON", "ALL_OFF", "ALL_TOGGLE"])
+            commands.update(("ALL_ON", "ALL_OFF", "ALL_TOGGLE"))
         
         # Generate SKU-specific ALL commands
         sku_groups = self._group_devices_by_sku()
@@ -115,16 +250,16 @@ class GoveeRemote:
             # Only add SKU-specific commands if there are multiple devices in that SKU
             if len(sku_groups[sku]) > 1:
                 sku_clean = sku.replace("-", "_").upper()
-                commands.extend([f"{sku_clean}_ALL_ON", f"{sku_clean}_ALL_OFF", f"{sku_clean}_ALL_TOGGLE"])
-                _LOG.debug(f"Generated SKU commands for {sku}: {sku_clean}_ALL_ON/OFF/TOGGLE")
+                commands.update((f"{sku_clean}_ALL_ON", f"{sku_clean}_ALL_OFF", f"{sku_clean}_ALL_TOGGLE"))
+                _LOG.debug("Generated SKU commands for %s: %s_ALL_ON/OFF/TOGGLE", sku, sku_clean)
         
-        return sorted(list(set(commands)))
+        return sorted(commands)
     
-    def _clean_command_name(self, name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _clean_command_name(name: str) -> str:
         cleaned = "".join(c if c.isalnum() else "_" for c in name.upper())
-        while "__" in cleaned:
-            cleaned = cleaned.replace("__", "_")
-        return cleaned.strip("_")
+        return _UNDERSCORE_RUNS.sub("_", cleaned).strip("_")
     
     def _generate_button_mapping(self) -> List[dict]:
         mappings = []
@@ -150,14 +285,17 @@ class GoveeRemote:
         return mappings
     
     def _find_primary_device(self) -> Dict[str, Any]:
-        priority_types = ["sync_box", "light", "kettle", "humidifier", "heater", "switch", "socket", "sensor"]
+        lowest_rank = len(_PRIMARY_TYPE_RANK)
+        best_rank, best = lowest_rank, None
         
-        for device_type in priority_types:
-            for device_info in self._discovered_devices.values():
-                if device_info.get("type") == device_type:
-                    return device_info
+        for device_info in self._discovered_devices.values():
+            rank = _PRIMARY_TYPE_RANK.get(device_info.get("type"), lowest_rank)
+            if rank < best_rank:
+                best_rank, best = rank, device_info
+                if rank == 0:
+                    break
         
-        return next(iter(self._discovered_devices.values())) if self._discovered_devices else {}
+        return best or next(iter(self._discovered_devices.values()), {})
     
     def _find_device_with_capability(self, capability: str) -> Dict[str, Any]:
         for device_info in self._discovered_devices.values():
@@ -169,64 +307,57 @@ class GoveeRemote:
         pages = []
         
         if not self._discovered_devices:
-            main_page = UiPage(page_id="main", name="No Devices", grid=Size(4, 6))
-            main_page.add(create_ui_text("No devices found", 0, 0, Size(4, 1)))
+            main_page = UiPage(page_id="main", name="No Devices", grid=_GRID_SIZE)
+            main_page.add(create_ui_text("No devices found", 0, 0, _SIZE_4X1))
             pages.append(main_page)
             return pages
         
-        device_directory = self._create_device_directory_page()
-        pages.append(device_directory)
-        
-        sku_pages = self._create_sku_control_pages()
-        pages.extend(sku_pages)
+        pages = self._build_all_pages(self._group_devices_by_sku())
         
-        _LOG.info(f"Created scalable UI: 1 directory + {len(sku_pages)} SKU pages = {len(pages)} total pages")
+        _LOG.info("Created scalable UI: 1 directory + %s SKU pages = %s total pages", len(pages) - 1, len(pages))
         return pages
     
-    def _create_device_directory_page(self) -> UiPage:
-        directory_page = UiPage(page_id="main", name="Govee Devices", grid=Size(4, 6))
-        directory_page.add(create_ui_text("Govee Devices", 0, 0, Size(4, 1)))
-        
-        sku_groups = self._group_devices_by_sku()
-        x, y = 0, 1
+    def _build_all_pages(self, sku_groups: Dict[str, Dict[str, Any]]) -> List[UiPage]:
+        """Build the device directory page and one control page per SKU in a single pass."""
+        directory_page = UiPage(page_id="main", name="Govee Devices", grid=_GRID_SIZE)
+        directory_page.add(create_ui_text("Govee Devices", 0, 0, _SIZE_4X1))
+        sku_pages = []
+        y = 1
         
         for sku, devices in sku_groups.items():
-            if y >= 6:
-                break
-            
-            device_type_name = self._get_sku_display_name(sku, devices)
-            directory_page.add(create_ui_text(f"{device_type_name}:", 0, y, Size(4, 1)))
-            y += 1
+            page_name = self._get_sku_display_name(sku, devices)
             
-            for device_id, device_info in devices.items():
-                if y >= 6:
-                    break
-                    
-                device_name = device_info.get("name", f"Device {device_id}")
-                display_name = device_name[:18] if len(device_name) > 18 else device_name
-                directory_page.add(create_ui_text(f"• {display_name}", 0, y, Size(4, 1)))
+            # Directory entry: SKU heading plus as many device names as still fit
+            if y < 6:
+                directory_page.add(create_ui_text(f"{page_name}:", 0, y, _SIZE_4X1))
                 y += 1
+                
+                for device_id in devices:
+                    if y >= 6:
+                        break
+                    directory_page.add(create_ui_text(f"• {self._names[device_id][:18]}", 0, y, _SIZE_4X1))
+                    y += 1
+                
+                y += 1 if y < 6 else 0
             
-            y += 1 if y < 6 else 0
+            sku_pages.append(self._create_sku_page(sku, devices, page_name))
         
         if len(self._discovered_devices) > 1 and y < 5:
-            directory_page.add(create_ui_text("All On", 0, 5, Size(2, 1), "ALL_ON"))
-            directory_page.add(create_ui_text("All Off", 2, 5, Size(2, 1), "ALL_OFF"))
+            directory_page.add(create_ui_text("All On", 0, 5, _SIZE_2X1, "ALL_ON"))
+            directory_page.add(create_ui_text("All Off", 2, 5, _SIZE_2X1, "ALL_OFF"))
             _LOG.debug("Added GLOBAL All On/Off buttons to directory page")
         
-        return directory_page
+        return [directory_page, *sku_pages]
     
     def _group_devices_by_sku(self) -> Dict[str, Dict[str, Any]]:
-        sku_groups = {}
+        if self._sku_groups is not None:
+            return self._sku_groups
         
+        sku_groups = {}
         for device_id, device_info in self._discovered_devices.items():
-            sku = device_info.get("sku", "Unknown")
-            
-            if sku not in sku_groups:
-                sku_groups[sku] = {}
-            
-            sku_groups[sku][device_id] = device_info
+            sku_groups.setdefault(device_info.get("sku", "Unknown"), {})[device_id] = device_info
         
+        self._sku_groups = sku_groups
         return sku_groups
     
     def _get_sku_display_name(self, sku: str, devices: Dict[str, Any]) -> str:
@@ -253,22 +384,10 @@ class GoveeRemote:
         else:
             return f"{friendly_name} ({sku})"
     
-    def _create_sku_control_pages(self) -> List[UiPage]:
-        sku_groups = self._group_devices_by_sku()
-        pages = []
-        
-        for sku, devices in sku_groups.items():
-            page = self._create_sku_page(sku, devices)
-            if page:
-                pages.append(page)
-        
-        return pages
-    
-    def _create_sku_page(self, sku: str, devices: Dict[str, Any]) -> UiPage:
-        page_name = self._get_sku_display_name(sku, devices)
+    def _create_sku_page(self, sku: str, devices: Dict[str, Any], page_name: str) -> UiPage:
         page_id = f"sku_{sku.replace('-', '_').lower()}"
-        page = UiPage(page_id=page_id, name=page_name, grid=Size(4, 6))
-        page.add(create_ui_text(page_name, 0, 0, Size(4, 1)))
+        page = UiPage(page_id=page_id, name=page_name, grid=_GRID_SIZE)
+        page.add(create_ui_text(page_name, 0, 0, _SIZE_4X1))
         
         y = 1
         
@@ -282,133 +401,118 @@ class GoveeRemote:
         else:
             y = self._add_multi_device_controls_to_page(page, sku, devices, start_y=y)
         
-        _LOG.info(f"Created SKU page for {sku}: {len(devices)} devices, {y} rows used")
+        _LOG.info("Created SKU page for %s: %s devices, %s rows used", sku, len(devices), y)
         return page
     
+    @staticmethod
+    def _add_button_row(page: UiPage, clean_name: str, cells: Tuple[Tuple[str, str], ...], y: int) -> None:
+        """Add a row of 1x1 buttons, one per (label, command suffix) cell, from x=0."""
+        for x, (label, suffix) in enumerate(cells):
+            page.add(create_ui_text(label, x, y, _SIZE_1X1, f"{clean_name}_{suffix}"))
+    
+    @staticmethod
+    def _add_mode_grid(page: UiPage, clean_name: str, kind: str, modes: List[Dict[str, Any]], y: int,
+                       label_len: int, limit: int = 4) -> int:
+        """Lay out up to limit mode buttons left to right, four per row, from row y.
+        
+        Returns the first row below the buttons that were placed.
+        """
+        cells = product(range(y, _GRID_ROWS), range(_GRID_COLUMNS))
+        next_y = y
+        for (row, x), (i, mode) in zip(cells, enumerate(islice(modes, limit))):
+            mode_name = mode.get("name") or f"Mode{i+1}"
+            cmd = f"{clean_name}_{kind}_{_command_token(mode_name)}"
+            page.add(create_ui_text(mode_name[:label_len], x, row, _SIZE_1X1, cmd))
+            next_y = row + 1
+        return next_y
+    
     def _add_sync_box_controls(self, page: UiPage, device_id: str, device_info: Dict[str, Any], start_y: int) -> int:
-        device_name = device_info.get("name", f"Device {device_id}")
+        device_name = self._names[device_id]
         clean_name = self._clean_command_name(device_name)
+        caps = self._caps[device_id]
         x, y = 0, start_y
         
-        if device_info.get("supports_power"):
-            page.add(create_ui_text("On", x, y, Size(1, 1), f"{clean_name}_ON"))
-            page.add(create_ui_text("Off", x + 1, y, Size(1, 1), f"{clean_name}_OFF"))
-            page.add(create_ui_text("Toggle", x + 2, y, Size(2, 1), f"{clean_name}_TOGGLE"))
+        if caps & _CAP_POWER:
+            page.add(create_ui_text("On", x, y, _SIZE_1X1, f"{clean_name}_ON"))
+            page.add(create_ui_text("Off", x + 1, y, _SIZE_1X1, f"{clean_name}_OFF"))
+            page.add(create_ui_text("Toggle", x + 2, y, _SIZE_2X1, f"{clean_name}_TOGGLE"))
             y += 1
         
-        if device_info.get("supports_dreamview"):
-            page.add(create_ui_text("DreamView", 0, y, Size(2, 1), f"{clean_name}_DREAMVIEW_ON"))
-            page.add(create_ui_text("DV Off", 2, y, Size(2, 1), f"{clean_name}_DREAMVIEW_OFF"))
+        if caps & _CAP_DREAMVIEW:
+            page.add(create_ui_text("DreamView", 0, y, _SIZE_2X1, f"{clean_name}_DREAMVIEW_ON"))
+            page.add(create_ui_text("DV Off", 2, y, _SIZE_2X1, f"{clean_name}_DREAMVIEW_OFF"))
             y += 1
         
-        if device_info.get("supports_gradient"):
-            page.add(create_ui_text("Gradient", 0, y, Size(2, 1), f"{clean_name}_GRADIENT_ON"))
-            page.add(create_ui_text("Grad Off", 2, y, Size(2, 1), f"{clean_name}_GRADIENT_OFF"))
+        if caps & _CAP_GRADIENT:
+            page.add(create_ui_text("Gradient", 0, y, _SIZE_2X1, f"{clean_name}_GRADIENT_ON"))
+            page.add(create_ui_text("Grad Off", 2, y, _SIZE_2X1, f"{clean_name}_GRADIENT_OFF"))
             y += 1
         
-        if device_info.get("supports_music"):
-            music_modes = device_info.get("music_modes", [])
-            for i, mode in enumerate(music_modes[:4]):
-                if y >= 6:
-                    break
-                mode_name = mode.get("name", f"Mode{i+1}")
-                display_name = mode_name[:7]
-                cmd = f"{clean_name}_MUSIC_{mode_name.upper().replace(' ', '_')}"
-                page.add(create_ui_text(display_name, i % 4, y, Size(1, 1), cmd))
-            y += 1
+        if caps & _CAP_MUSIC:
+            y = self._add_mode_grid(page, clean_name, "MUSIC", device_info.get("music_modes", []), y, label_len=7)
             
             if y < 6:
-                page.add(create_ui_text("Sens -", 0, y, Size(2, 1), f"{clean_name}_SENSITIVITY_DOWN"))
-                page.add(create_ui_text("Sens +", 2, y, Size(2, 1), f"{clean_name}_SENSITIVITY_UP"))
+                page.add(create_ui_text("Sens -", 0, y, _SIZE_2X1, f"{clean_name}_SENSITIVITY_DOWN"))
+                page.add(create_ui_text("Sens +", 2, y, _SIZE_2X1, f"{clean_name}_SENSITIVITY_UP"))
                 y += 1
         
-        if device_info.get("supports_brightness") and y < 5:
-            page.add(create_ui_text("25%", 0, y, Size(1, 1), f"{clean_name}_BRIGHTNESS_25"))
-            page.add(create_ui_text("50%", 1, y, Size(1, 1), f"{clean_name}_BRIGHTNESS_50"))
-            page.add(create_ui_text("75%", 2, y, Size(1, 1), f"{clean_name}_BRIGHTNESS_75"))
-            page.add(create_ui_text("100%", 3, y, Size(1, 1), f"{clean_name}_BRIGHTNESS_100"))
+        if caps & _CAP_BRIGHTNESS and y < 5:
+            self._add_button_row(page, clean_name, _BRIGHTNESS_CELLS, y)
             y += 1
         
-        if device_info.get("supports_color") and y < 5:
-            page.add(create_ui_text("Red", 0, y, Size(1, 1), f"{clean_name}_COLOR_RED"))
-            page.add(create_ui_text("Green", 1, y, Size(1, 1), f"{clean_name}_COLOR_GREEN"))
-            page.add(create_ui_text("Blue", 2, y, Size(1, 1), f"{clean_name}_COLOR_BLUE"))
-            page.add(create_ui_text("White", 3, y, Size(1, 1), f"{clean_name}_COLOR_WHITE"))
+        if caps & _CAP_COLOR and y < 5:
+            self._add_button_row(page, clean_name, _COLOR_CELLS, y)
             y += 1
         
         return y
     
     def _add_device_controls_to_page(self, page: UiPage, device_id: str, device_info: Dict[str, Any], start_y: int) -> int:
-        device_name = device_info.get("name", f"Device {device_id}")
+        device_name = self._names[device_id]
         clean_name = self._clean_command_name(device_name)
+        caps = self._caps[device_id]
         x, y = 0, start_y
         
-        if device_info.get("supports_power"):
-            page.add(create_ui_text("On", x, y, Size(1, 1), f"{clean_name}_ON"))
-            page.add(create_ui_text("Off", x + 1, y, Size(1, 1), f"{clean_name}_OFF"))
-            page.add(create_ui_text("Toggle", x + 2, y, Size(2, 1), f"{clean_name}_TOGGLE"))
+        if caps & _CAP_POWER:
+            page.add(create_ui_text("On", x, y, _SIZE_1X1, f"{clean_name}_ON"))
+            page.add(create_ui_text("Off", x + 1, y, _SIZE_1X1, f"{clean_name}_OFF"))
+            page.add(create_ui_text("Toggle", x + 2, y, _SIZE_2X1, f"{clean_name}_TOGGLE"))
             y += 1
         
-        if device_info.get("supports_temperature"):
-            temp_range = device_info.get("temperature_range", (20, 100))
+        if caps & _CAP_TEMPERATURE:
+            temp_range = device_info.get("temperature_range", _DEFAULT_TEMP_RANGE)
             min_temp, max_temp = temp_range
             
             if max_temp >= 100:
-                temps = [60, 70, 80, 90]
-                for i, temp in enumerate(temps):
-                    page.add(create_ui_text(f"{temp}°", i, y, Size(1, 1), f"{clean_name}_TEMP_{temp}"))
+                self._add_button_row(page, clean_name, _KETTLE_TEMP_CELLS, y)
                 y += 1
                 
-                page.add(create_ui_text("Temp -", 0, y, Size(2, 1), f"{clean_name}_TEMP_DOWN"))
-                page.add(create_ui_text("Temp +", 2, y, Size(2, 1), f"{clean_name}_TEMP_UP"))
+                page.add(create_ui_text("Temp -", 0, y, _SIZE_2X1, f"{clean_name}_TEMP_DOWN"))
+                page.add(create_ui_text("Temp +", 2, y, _SIZE_2X1, f"{clean_name}_TEMP_UP"))
                 y += 1
             
             elif max_temp >= 40:
-                temps = [20, 25, 30, 35]
-                for i, temp in enumerate(temps):
-                    page.add(create_ui_text(f"{temp}°", i, y, Size(1, 1), f"{clean_name}_TEMP_{temp}"))
+                self._add_button_row(page, clean_name, _ROOM_TEMP_CELLS, y)
                 y += 1
         
-        if device_info.get("supports_work_mode"):
-            work_modes = device_info.get("work_modes", [])
-            
-            for i, mode in enumerate(work_modes[:4]):
-                if y >= 6:
-                    break
-                mode_name = mode.get("name", f"Mode{i+1}")
-                display_name = mode_name[:6]
-                cmd = f"{clean_name}_MODE_{mode_name.upper().replace(' ', '_')}"
-                
-                page.add(create_ui_text(display_name, i % 4, y, Size(1, 1), cmd))
-                
-                if (i + 1) % 4 == 0:
-                    y += 1
-            
-            if len(work_modes) % 4 != 0:
-                y += 1
+        if caps & _CAP_WORK_MODE:
+            y = self._add_mode_grid(page, clean_name, "MODE", device_info.get("work_modes", []), y, label_len=6)
         
-        elif device_info.get("supports_brightness") and y < 5:
-            page.add(create_ui_text("25%", 0, y, Size(1, 1), f"{clean_name}_BRIGHTNESS_25"))
-            page.add(create_ui_text("50%", 1, y, Size(1, 1), f"{clean_name}_BRIGHTNESS_50"))
-            page.add(create_ui_text("75%", 2, y, Size(1, 1), f"{clean_name}_BRIGHTNESS_75"))
-            page.add(create_ui_text("100%", 3, y, Size(1, 1), f"{clean_name}_BRIGHTNESS_100"))
+        elif caps & _CAP_BRIGHTNESS and y < 5:
+            self._add_button_row(page, clean_name, _BRIGHTNESS_CELLS, y)
             y += 1
             
             if y < 6:
-                page.add(create_ui_text("Bright -", 0, y, Size(2, 1), f"{clean_name}_BRIGHTNESS_DOWN"))
-                page.add(create_ui_text("Bright +", 2, y, Size(2, 1), f"{clean_name}_BRIGHTNESS_UP"))
+                page.add(create_ui_text("Bright -", 0, y, _SIZE_2X1, f"{clean_name}_BRIGHTNESS_DOWN"))
+                page.add(create_ui_text("Bright +", 2, y, _SIZE_2X1, f"{clean_name}_BRIGHTNESS_UP"))
                 y += 1
         
-        if device_info.get("supports_color") and y < 5:
-            page.add(create_ui_text("Red", 0, y, Size(1, 1), f"{clean_name}_COLOR_RED"))
-            page.add(create_ui_text("Green", 1, y, Size(1, 1), f"{clean_name}_COLOR_GREEN"))
-            page.add(create_ui_text("Blue", 2, y, Size(1, 1), f"{clean_name}_COLOR_BLUE"))
-            page.add(create_ui_text("White", 3, y, Size(1, 1), f"{clean_name}_COLOR_WHITE"))
+        if caps & _CAP_COLOR and y < 5:
+            self._add_button_row(page, clean_name, _COLOR_CELLS, y)
             y += 1
             
             if y < 6:
-                page.add(create_ui_text("Warm", 0, y, Size(2, 1), f"{clean_name}_COLOR_WARM"))
-                page.add(create_ui_text("Cool", 2, y, Size(2, 1), f"{clean_name}_COLOR_COOL"))
+                page.add(create_ui_text("Warm", 0, y, _SIZE_2X1, f"{clean_name}_COLOR_WARM"))
+                page.add(create_ui_text("Cool", 2, y, _SIZE_2X1, f"{clean_name}_COLOR_COOL"))
                 y += 1
         
         return y
@@ -421,12 +525,12 @@ class GoveeRemote:
             if y >= 5:
                 break
                 
-            device_name = device_info.get("name", f"Device {device_id}")
+            device_name = self._names[device_id]
             clean_name = self._clean_command_name(device_name)
             
             display_name = device_name[:12] if len(device_name) > 12 else device_name
-            page.add(create_ui_text(display_name, 0, y, Size(2, 1)))
-            page.add(create_ui_text("Toggle", 2, y, Size(2, 1), f"{clean_name}_TOGGLE"))
+            page.add(create_ui_text(display_name, 0, y, _SIZE_2X1))
+            page.add(create_ui_text("Toggle", 2, y, _SIZE_2X1, f"{clean_name}_TOGGLE"))
             y += 1
         
         # Add SKU-specific All On/Off buttons
@@ -435,23 +539,122 @@ class GoveeRemote:
             
             if first_device.get("supports_power"):
                 sku_clean = sku.replace("-", "_").upper()
-                page.add(create_ui_text("All On", 0, 5, Size(2, 1), f"{sku_clean}_ALL_ON"))
-                page.add(create_ui_text("All Off", 2, 5, Size(2, 1), f"{sku_clean}_ALL_OFF"))
-                _LOG.debug(f"Added SKU-specific buttons for {sku}: {sku_clean}_ALL_ON/OFF")
+                page.add(create_ui_text("All On", 0, 5, _SIZE_2X1, f"{sku_clean}_ALL_ON"))
+                page.add(create_ui_text("All Off", 2, 5, _SIZE_2X1, f"{sku_clean}_ALL_OFF"))
+                _LOG.debug("Added SKU-specific buttons for %s: %s_ALL_ON/OFF", sku, sku_clean)
         
         return y
+
+
+class GoveeRemote(_RemoteLayout):
+    """Govee remote entity with scalable SKU-based UI organization."""
+    
+    # Upper bound on concurrent state reads when refreshing every device
+    STATE_REFRESH_CONCURRENCY = 8
+    # Entries kept in each per-command memo; command strings come from clients, so keep them bounded
+    ACTION_CACHE_SIZE = 512
+    
+    def __init__(self, api: ucapi.IntegrationAPI, client: GoveeClient, config: 'GoveeConfig'):
+        super().__init__(config.devices)
+        self._api = api
+        self._client = client
+        self._config = config
+        self._device_throttle = {}
+        self._global_throttle = 0
+        self._device_states = {}
+        self._states_refreshed = False
+        self._action_map_cache: Dict[Tuple[str, str], Optional[str]] = {}
+        # (device id, client action) -> bound client call, None when the device cannot perform it
+        self._dispatch_cache: Dict[Tuple[str, str], Optional[Callable[[], Awaitable[bool]]]] = {}
+        
+        # Cleaned device name -> device id, for dispatching "<NAME>_<ACTION>" commands
+        self._prefix_to_device: Dict[str, str] = {}
+        for device_id, device_info in self._discovered_devices.items():
+            clean_name = self._clean_command_name(self._names[device_id])
+            self._prefix_to_device.setdefault(clean_name, device_id)
+        
+        # Devices that ALL_* commands act on; a missing supports_power flag counts as supported
+        self._power_device_ids: List[str] = []
+        self._no_power_device_names: List[str] = []
+        for device_id, device_info in self._discovered_devices.items():
+            if device_info.get("supports_power", True):
+                self._power_device_ids.append(device_id)
+            else:
+                self._no_power_device_names.append(self._names[device_id])
+        
+        # One client-side device wrapper per device, shared by every command and state read
+        self._govee_devices: Dict[str, GoveeDevice] = {
+            device_id: GoveeDevice({
+                "sku": device_info.get("sku", ""),
+                "device": device_id,
+                "deviceName": self._names[device_id],
+                "type": device_info.get("api_type", ""),
+                "capabilities": device_info.get("capabilities", [])
+            })
+            for device_id, device_info in self._discovered_devices.items()
+        }
+        
+        _LOG.info("Creating remote with %s discovered devices", len(self._discovered_devices))
+        
+        features = [Features.ON_OFF, Features.SEND_CMD]
+        simple_commands = self._generate_simple_commands()
+        button_mapping = self._generate_button_mapping()
+        ui_pages = self._create_scalable_ui_pages()
+        
+        self.entity = ucapi.Remote(
+            identifier="govee_remote_main",
+            name={"en": "Govee Remote"},
+            features=features,
+            attributes={"state": States.ON},
+            simple_commands=simple_commands,
+            button_mapping=button_mapping,
+            ui_pages=ui_pages,
+            cmd_handler=self.cmd_handler
+        )
+        
+        _LOG.info("Govee remote entity created with %s commands and %s UI pages", len(simple_commands), len(ui_pages))
     
     async def push_initial_state(self):
         _LOG.info("Setting initial remote entity state")
         
         if not self._api.configured_entities.contains(self.entity.id):
-            _LOG.warning(f"Entity {self.entity.id} not in configured entities yet")
+            _LOG.warning("Entity %s not in configured entities yet", self.entity.id)
             return
         
         initial_state = States.ON
         initial_attributes = {"state": initial_state}
         self._api.configured_entities.update_attributes(self.entity.id, initial_attributes)
-        _LOG.info(f"Initial state set successfully - remote entity is {initial_state}")
+        _LOG.info("Initial state set successfully - remote entity is %s", initial_state)
+
+    async def refresh_all_states(self) -> None:
+        """Read every device's power state once so toggles start from real state."""
+        if self._states_refreshed or not self._discovered_devices:
+            return
+        self._states_refreshed = True
+        
+        states = await self._client.get_device_states(list(self._govee_devices.values()), self.STATE_REFRESH_CONCURRENCY)
+        for device_id, state_data in states.items():
+            if isinstance(state_data, Exception):
+                _LOG.warning("Failed to get state for device %s: %s", device_id, state_data)
+            else:
+                self._apply_power_state(device_id, state_data)
+        _LOG.info("Refreshed power state for %s devices", len(self._discovered_devices))
+
+    def _apply_power_state(self, device_id: str, state_data: Dict[str, Any]) -> Optional[bool]:
+        """Cache the power state found in a device state response; None if it has none."""
+        if not state_data:
+            return None
+        power = next(
+            (capability for capability in state_data.get('capabilities', ())
+             if capability.get('type') == _ON_OFF_TYPE and capability.get('instance') == _POWER_INSTANCE),
+            None
+        )
+        if power is None:
+            return None
+        is_on = bool(power.get('state', {}).get('value', 0))
+        self._device_states[device_id] = is_on
+        _LOG.debug("Device %s state from API: %s", device_id, is_on)
+        return is_on
 
     async def _get_device_state(self, device_id: str) -> bool:
         try:
@@ -459,57 +662,38 @@ class GoveeRemote:
             if not device_info:
                 return False
         
-            from uc_intg_govee.client import GoveeDevice
-        
-            device_data = {
-                "sku": device_info.get("sku", ""),
-                "device": device_id,
-                "deviceName": device_info.get("name", ""),
-                "type": device_info.get("api_type", ""),
-                "capabilities": device_info.get("capabilities", [])
-            }
-        
-            device = GoveeDevice(device_data)
-            state_data = await self._client.get_device_state(device)
-        
-            if state_data and 'capabilities' in state_data:
-                for capability in state_data['capabilities']:
-                    if capability.get('type') == 'devices.capabilities.on_off' and capability.get('instance') == 'powerSwitch':
-                        value = capability.get('state', {}).get('value', 0)
-                        is_on = bool(value)
-                        self._device_states[device_id] = is_on
-                        _LOG.debug(f"Device {device_id} state from API: {is_on}")
-                        return is_on
+            device = self._govee_devices[device_id]
+            is_on = self._apply_power_state(device_id, await self._client.get_device_state(device))
+            if is_on is not None:
+                return is_on
         
             cached_state = self._device_states.get(device_id, False)
-            _LOG.debug(f"Device {device_id} using cached state: {cached_state}")
+            _LOG.debug("Device %s using cached state: %s", device_id, cached_state)
             return cached_state
         
         except Exception as e:
-            _LOG.warning(f"Failed to get state for device {device_id}: {e}")
+            _LOG.warning("Failed to get state for device %s: %s", device_id, e)
             return self._device_states.get(device_id, False)
         
-    async def _check_throttle(self, device_id: str) -> bool:
+    def _check_throttle(self, device_id: str) -> bool:
         """Check if a command can be sent to a device without violating throttle limits.
         
         Returns True if safe to proceed, False if throttled.
         """
-        import time
-        
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Global throttle: 100ms between ANY commands
         if current_time - self._global_throttle < 0.1:
             return False
         
         # Device throttle: 300ms between commands to SAME device
-        last_time = self._device_throttle.get(device_id, 0)
-        if current_time - last_time < 0.3:
+        device_throttle = self._device_throttle
+        if current_time - device_throttle.get(device_id, 0) < 0.3:
             return False
         
         # Update throttle timestamps
         self._global_throttle = current_time
-        self._device_throttle[device_id] = current_time
+        device_throttle[device_id] = current_time
         return True
 
     async def cmd_handler(self, entity: ucapi.Entity, cmd_id: str, params: dict[str, Any] | None) -> ucapi.StatusCodes:
@@ -554,81 +738,78 @@ class GoveeRemote:
             if not self._discovered_devices or command == "NO_DEVICES":
                 return False
             
-            _LOG.info(f"🎯 EXECUTING COMMAND: {command}")
+            _LOG.info("🎯 EXECUTING COMMAND: %s", command)
             
             # Check for SKU-specific ALL commands BEFORE global commands
             # Pattern: "<SKU>_ALL_<ACTION>" where SKU can contain underscores
             if "_ALL_" in command:
                 # Could be SKU-specific or global
-                if command in ["ALL_ON", "ALL_OFF", "ALL_TOGGLE"]:
+                if command in _ALL_ACTION:
                     # Global command (no SKU prefix)
-                    _LOG.info(f"📢 Routing to GLOBAL command handler: {command}")
+                    _LOG.info("📢 Routing to GLOBAL command handler: %s", command)
                     return await self._execute_global_command(command)
                 else:
                     # SKU-specific command (has prefix before _ALL_)
-                    _LOG.info(f"🏷️  Routing to SKU-SPECIFIC command handler: {command}")
+                    _LOG.info("🏷️  Routing to SKU-SPECIFIC command handler: %s", command)
                     return await self._execute_sku_command(command)
             
             if command.startswith("ALL_"):
                 # Global command without _ALL_ pattern (shouldn't happen but handle anyway)
-                _LOG.info(f"📢 Routing to GLOBAL command handler: {command}")
+                _LOG.info("📢 Routing to GLOBAL command handler: %s", command)
                 return await self._execute_global_command(command)
             
             # Individual device command
-            _LOG.debug(f"🔧 Routing to DEVICE command handler: {command}")
+            _LOG.debug("🔧 Routing to DEVICE command handler: %s", command)
             return await self._execute_device_command(command)
             
         except Exception as e:
-            _LOG.error(f"❌ Error executing Govee command {command}: {e}", exc_info=True)
+            _LOG.error("❌ Error executing Govee command %s: %s", command, e, exc_info=True)
             return False
     
     async def _execute_global_command(self, command: str) -> bool:
         """Execute global commands (ALL_ON, ALL_OFF, ALL_TOGGLE) on ALL devices."""
-        _LOG.info(f"🌍 GLOBAL COMMAND: {command} for ALL {len(self._discovered_devices)} devices")
+        action = _ALL_ACTION.get(command)
+        if action is None:
+            _LOG.error("❌ Unknown global command: %s", command)
+            return False
+        
+        _LOG.info("🌍 GLOBAL COMMAND: %s for ALL %s devices", command, len(self._discovered_devices))
         
         # Pre-wait to reduce risk of hitting recent command throttles
         await asyncio.sleep(0.15)
         
         success_count = 0
         failed_devices = []
-        skipped_devices = []
         
-        for device_id, device_info in self._discovered_devices.items():
-            if not device_info.get("supports_power", True):
-                skipped_devices.append(device_info.get('name', device_id))
-                continue
-                
-            device_name = device_info.get('name', f'Device_{device_id}')
+        execute = self._execute_device_action_with_retry
+        names = self._names
+        
+        for device_id in self._power_device_ids:
+            device_name = names[device_id]
             
             try:
-                if command == "ALL_ON":
-                    result = await self._execute_device_action_with_retry(device_id, "turn_on", device_name)
-                elif command == "ALL_OFF":
-                    result = await self._execute_device_action_with_retry(device_id, "turn_off", device_name)
-                elif command == "ALL_TOGGLE":
-                    result = await self._execute_device_action_with_retry(device_id, "toggle", device_name)
-                else:
-                    continue
+                result = await execute(device_id, action, device_name)
                 
                 if result:
                     success_count += 1
-                    _LOG.info(f"  ✅ {device_name}")
+                    _LOG.info("  ✅ %s", device_name)
                 else:
                     failed_devices.append(device_name)
-                    _LOG.warning(f"  ❌ {device_name}")
+                    _LOG.warning("  ❌ %s", device_name)
                 
                 # Delay between devices (respects 10 req/60s = 150ms minimum)
                 await asyncio.sleep(0.15)
                 
             except Exception as e:
                 failed_devices.append(device_name)
-                _LOG.error(f"  ⚠️  Exception on {device_name}: {e}")
+                _LOG.error("  ⚠️  Exception on %s: %s", device_name, e)
         
-        _LOG.info(f"🌍 GLOBAL {command} RESULT: {success_count}/{len(self._discovered_devices)} succeeded, {len(failed_devices)} failed, {len(skipped_devices)} skipped")
+        skipped_devices = self._no_power_device_names
+        _LOG.info("🌍 GLOBAL %s RESULT: %s/%s succeeded, %s failed, %s skipped", command, success_count, len(self._discovered_devices), len(failed_devices), len(skipped_devices))
         if failed_devices:
-            _LOG.warning(f"   Failed: {', '.join(failed_devices)}")
+            _LOG.warning("   Failed: %s", ', '.join(failed_devices))
         if skipped_devices:
-            _LOG.info(f"   Skipped (no power support): {', '.join(skipped_devices)}")
+            _LOG.info("   Skipped (no power support): %s", ', '.join(skipped_devices))
         
         return success_count > 0
     
@@ -640,13 +821,17 @@ class GoveeRemote:
         # Parse command: "H6010_ALL_ON" -> sku_prefix="H6010", action="ALL_ON"
         parts = command.split("_ALL_")
         if len(parts) != 2:
-            _LOG.error(f"❌ Invalid SKU command format: {command} (expected format: SKU_ALL_ACTION)")
+            _LOG.error("❌ Invalid SKU command format: %s (expected format: SKU_ALL_ACTION)", command)
             return False
         
         sku_prefix = parts[0]  # e.g., "H6010"
         action = f"ALL_{parts[1]}"  # e.g., "ALL_ON", "ALL_OFF", "ALL_TOGGLE"
+        device_action = _ALL_ACTION.get(action)
+        if device_action is None:
+            _LOG.error("❌ Unknown action: %s", action)
+            return False
         
-        _LOG.info(f"🏷️  SKU COMMAND: {command} -> SKU={sku_prefix}, ACTION={action}")
+        _LOG.info("🏷️  SKU COMMAND: %s -> SKU=%s, ACTION=%s", command, sku_prefix, action)
         
         # Find matching SKU (handle case variations and hyphen/underscore normalization)
         target_sku = None
@@ -656,75 +841,69 @@ class GoveeRemote:
             sku_normalized = sku.replace("-", "_").upper()
             if sku_normalized == sku_prefix:
                 target_sku = sku
-                _LOG.info(f"   ✓ Matched SKU: {sku} (normalized: {sku_normalized})")
+                _LOG.info("   ✓ Matched SKU: %s (normalized: %s)", sku, sku_normalized)
                 break
         
         if not target_sku:
-            _LOG.error(f"❌ Could not find SKU matching prefix: {sku_prefix}")
-            _LOG.error(f"   Available SKUs: {list(sku_groups.keys())}")
-            _LOG.error(f"   Available normalized: {[sku.replace('-', '_').upper() for sku in sku_groups.keys()]}")
+            _LOG.error("❌ Could not find SKU matching prefix: %s", sku_prefix)
+            _LOG.error("   Available SKUs: %s", list(sku_groups.keys()))
+            _LOG.error("   Available normalized: %s", [sku.replace('-', '_').upper() for sku in sku_groups.keys()])
             return False
         
         # Get devices ONLY for this SKU
         sku_devices = sku_groups.get(target_sku, {})
         
         if not sku_devices:
-            _LOG.warning(f"⚠️  No devices found for SKU: {target_sku}")
+            _LOG.warning("⚠️  No devices found for SKU: %s", target_sku)
             return False
         
-        _LOG.info(f"🏷️  Executing {action} for SKU '{target_sku}' ({len(sku_devices)} devices)")
-        _LOG.info(f"   Devices in this SKU: {[info.get('name', id) for id, info in sku_devices.items()]}")
+        _LOG.info("🏷️  Executing %s for SKU '%s' (%s devices)", action, target_sku, len(sku_devices))
+        _LOG.info("   Devices in this SKU: %s", [self._names[device_id] for device_id in sku_devices])
         
         # Pre-wait to reduce risk of hitting recent command throttles  
         await asyncio.sleep(0.15)
         
         success_count = 0
         failed_devices = []
+        power_devices = []
         skipped_devices = []
-        
         for device_id, device_info in sku_devices.items():
-            if not device_info.get("supports_power", True):
-                skipped_devices.append(device_info.get('name', device_id))
-                continue
-                
-            device_name = device_info.get('name', f'Device_{device_id}')
+            if device_info.get("supports_power", True):
+                power_devices.append((device_id, device_info))
+            else:
+                skipped_devices.append(self._names[device_id])
+        
+        for device_id, device_info in power_devices:
+            device_name = self._names[device_id]
             
             try:
-                if action == "ALL_ON":
-                    result = await self._execute_device_action_with_retry(device_id, "turn_on", device_name)
-                elif action == "ALL_OFF":
-                    result = await self._execute_device_action_with_retry(device_id, "turn_off", device_name)
-                elif action == "ALL_TOGGLE":
-                    result = await self._execute_device_action_with_retry(device_id, "toggle", device_name)
-                else:
-                    _LOG.error(f"❌ Unknown action: {action}")
-                    continue
+                result = await self._execute_device_action_with_retry(device_id, device_action, device_name)
                 
                 if result:
                     success_count += 1
-                    _LOG.info(f"  ✅ {device_name}")
+                    _LOG.info("  ✅ %s", device_name)
                 else:
                     failed_devices.append(device_name)
-                    _LOG.warning(f"  ❌ {device_name}")
+                    _LOG.warning("  ❌ %s", device_name)
                 
                 # Delay between devices (respects 10 req/60s = 150ms minimum)
                 await asyncio.sleep(0.15)
                 
             except Exception as e:
                 failed_devices.append(device_name)
-                _LOG.error(f"  ⚠️  Exception on {device_name}: {e}")
+                _LOG.error("  ⚠️  Exception on %s: %s", device_name, e)
         
-        _LOG.info(f"🏷️  SKU {command} RESULT: {success_count}/{len(sku_devices)} succeeded, {len(failed_devices)} failed, {len(skipped_devices)} skipped")
+        _LOG.info("🏷️  SKU %s RESULT: %s/%s succeeded, %s failed, %s skipped", command, success_count, len(sku_devices), len(failed_devices), len(skipped_devices))
         if failed_devices:
-            _LOG.warning(f"   Failed: {', '.join(failed_devices)}")
+            _LOG.warning("   Failed: %s", ', '.join(failed_devices))
         if skipped_devices:
-            _LOG.info(f"   Skipped (no power support): {', '.join(skipped_devices)}")
+            _LOG.info("   Skipped (no power support): %s", ', '.join(skipped_devices))
         
         # CRITICAL VALIDATION: Ensure we only affected devices in target SKU
         all_device_ids = set(self._discovered_devices.keys())
         sku_device_ids = set(sku_devices.keys())
         if not sku_device_ids.issubset(all_device_ids):
-            _LOG.error(f"❌ CRITICAL: SKU devices not subset of all devices! This should never happen!")
+            _LOG.error("❌ CRITICAL: SKU devices not subset of all devices! This should never happen!")
             
         return success_count > 0
     
@@ -733,69 +912,36 @@ class GoveeRemote:
         
         This replaces the old _execute_device_action_safe with better retry logic.
         """
+        check_throttle = self._check_throttle
+        
         for attempt in range(max_retries):
             try:
                 # Check throttle
-                if await self._check_throttle(device_id):
+                if check_throttle(device_id):
                     # Throttle OK, execute command
                     device_info = self._discovered_devices.get(device_id)
                     if not device_info:
-                        _LOG.error(f"Device {device_id} not found in discovered devices")
+                        _LOG.error("Device %s not found in discovered devices", device_id)
                         return False
                     
-                    from uc_intg_govee.client import GoveeDevice
-                    
-                    device_data = {
-                        "sku": device_info.get("sku", ""),
-                        "device": device_id,
-                        "deviceName": device_name,
-                        "type": device_info.get("api_type", ""),
-                        "capabilities": device_info.get("capabilities", [])
-                    }
-                    
-                    device = GoveeDevice(device_data)
-                    
-                    if action == "turn_on":
-                        result = await self._client.turn_on(device)
-                        if result:
-                            self._device_states[device_id] = True
-                        return result
-                        
-                    elif action == "turn_off":
-                        result = await self._client.turn_off(device)
-                        if result:
-                            self._device_states[device_id] = False
-                        return result
-                        
-                    elif action == "toggle":
-                        current_state = self._device_states.get(device_id, False)
-                        _LOG.debug(f"Toggle {device_name}: cached={'ON' if current_state else 'OFF'} -> {'OFF' if current_state else 'ON'}")
-                        
-                        if current_state:
-                            result = await self._client.turn_off(device)
-                            if result:
-                                self._device_states[device_id] = False
-                        else:
-                            result = await self._client.turn_on(device)
-                            if result:
-                                self._device_states[device_id] = True
-                        
-                        return result
-                    else:
-                        _LOG.error(f"Unknown action: {action}")
+                    if action not in _EXACT_ACTION_HANDLERS:
+                        _LOG.error("Unknown action: %s", action)
                         return False
+                    
+                    # Same handlers as single-device commands, including the cached power state updates
+                    return await self._execute_mapped_action(self._govee_devices[device_id], action, device_info, device_id)
                 else:
                     # Throttled, wait and retry
                     if attempt < max_retries - 1:
                         wait_time = 0.15 * (attempt + 1)  # 150ms, 300ms, 450ms
-                        _LOG.debug(f"⏳ Throttled: {device_name}, retry {attempt+1}/{max_retries} in {wait_time}s")
+                        _LOG.debug("⏳ Throttled: %s, retry %s/%s in %ss", device_name, attempt+1, max_retries, wait_time)
                         await asyncio.sleep(wait_time)
                     else:
-                        _LOG.warning(f"⏳ Throttled: {device_name} after {max_retries} attempts")
+                        _LOG.warning("⏳ Throttled: %s after %s attempts", device_name, max_retries)
                         return False
                         
             except Exception as e:
-                _LOG.error(f"❌ Exception executing {action} on {device_name}: {e}")
+                _LOG.error("❌ Exception executing %s on %s: %s", action, device_name, e)
                 if attempt < max_retries - 1:
                     await asyncio.sleep(0.2)
                 else:
@@ -803,212 +949,199 @@ class GoveeRemote:
         
         return False
     
+    def _match_device_command(self, command: str) -> Optional[Tuple[str, str]]:
+        """Split a device command into (device_id, action) on the longest known device prefix."""
+        parts = command.split("_")
+        for i in range(len(parts) - 1, 0, -1):
+            device_id = self._prefix_to_device.get("_".join(parts[:i]))
+            if device_id is not None:
+                return device_id, "_".join(parts[i:])
+        return None
+    
     async def _execute_device_command(self, command: str) -> bool:
         """Execute individual device commands (not ALL commands)."""
-        for device_id, device_info in self._discovered_devices.items():
-            device_name = device_info.get("name", f"Device_{device_id}")
-            device_prefix = self._clean_command_name(device_name)
-            
-            if command.startswith(device_prefix + "_"):
-                _LOG.debug(f"🔧 Device command: {command} -> {device_name}")
-                
-                # Check throttle with retry
-                if not await self._check_throttle(device_id):
-                    _LOG.debug(f"⏳ Throttled: {device_name}, waiting 200ms")
-                    await asyncio.sleep(0.2)
-                    if not await self._check_throttle(device_id):
-                        _LOG.warning(f"⏳ Still throttled: {device_name}")
-                        return False
-                
-                action_part = command[len(device_prefix)+1:]
-                govee_action_result = self._map_ui_action_to_govee_action(action_part, device_info)
-                
-                if govee_action_result:
-                    try:
-                        from uc_intg_govee.client import GoveeDevice
-                        
-                        device_data = {
-                            "sku": device_info.get("sku", ""),
-                            "device": device_id,
-                            "deviceName": device_name,
-                            "type": device_info.get("api_type", ""),
-                            "capabilities": device_info.get("capabilities", [])
-                        }
-                        
-                        device = GoveeDevice(device_data)
-                        return await self._execute_mapped_action(device, govee_action_result, device_info, device_id)
-                        
-                    except Exception as e:
-                        _LOG.error(f"❌ Exception executing action on {device_name}: {e}")
-                        return False
+        match = self._match_device_command(command)
+        if match is None:
+            _LOG.warning("❓ No device found for command: %s", command)
+            return False
+        
+        device_id, action_part = match
+        device_info = self._discovered_devices[device_id]
+        device_name = self._names[device_id]
+        _LOG.debug("🔧 Device command: %s -> %s", command, device_name)
+        
+        # Check throttle with retry
+        if not self._check_throttle(device_id):
+            _LOG.debug("⏳ Throttled: %s, waiting 200ms", device_name)
+            await asyncio.sleep(0.2)
+            if not self._check_throttle(device_id):
+                _LOG.warning("⏳ Still throttled: %s", device_name)
+                return False
+        
+        govee_action_result = self._map_ui_action_to_govee_action(action_part, device_id)
+        
+        if govee_action_result:
+            try:
+                device = self._govee_devices[device_id]
+                return await self._execute_mapped_action(device, govee_action_result, device_info, device_id)
                 
+            except Exception as e:
+                _LOG.error("❌ Exception executing action on %s: %s", device_name, e)
                 return False
         
-        _LOG.warning(f"❓ No device found for command: {command}")
         return False
     
-    async def _execute_mapped_action(self, device: 'GoveeDevice', action: str, device_info: Dict[str, Any], device_id: str = None) -> bool:
-        try:
-            if action == "turn_on":
-                result = await self._client.turn_on(device)
-                if result and device_id:
-                    self._device_states[device_id] = True
-                return result
-            elif action == "turn_off":
-                result = await self._client.turn_off(device)
-                if result and device_id:
-                    self._device_states[device_id] = False
-                return result
-            elif action == "toggle":
-                if device_id:
-                    current_state = self._device_states.get(device_id, False)
-                    _LOG.debug(f"Toggle {device.device_name}: cached={'ON' if current_state else 'OFF'} -> {'OFF' if current_state else 'ON'}")
-                    
-                    if current_state:
-                        result = await self._client.turn_off(device)
-                        if result:
-                            self._device_states[device_id] = False
-                    else:
-                        result = await self._client.turn_on(device)
-                        if result:
-                            self._device_states[device_id] = True
-                    
-                    return result
-                else:
-                    return await self._client.turn_on(device)
-            elif action == "dreamview_on":
-                return await self._client.set_dreamview(device, True)
-            elif action == "dreamview_off":
-                return await self._client.set_dreamview(device, False)
-            elif action == "gradient_on":
-                return await self._client.set_gradient(device, True)
-            elif action == "gradient_off":
-                return await self._client.set_gradient(device, False)
-            elif action.startswith("music_"):
-                mode_name = action.replace("music_", "").replace("_", " ").title()
-                music_modes = device_info.get("music_modes", [])
-                for mode in music_modes:
-                    if mode.get("name", "").lower() == mode_name.lower():
-                        return await self._client.set_music_mode(device, mode.get("value", 1), 50)
-                return False
-            elif action == "sensitivity_up":
-                return await self._client.set_music_mode(device, 1, 75)
-            elif action == "sensitivity_down":
-                return await self._client.set_music_mode(device, 1, 25)
-            elif action.startswith("brightness_"):
-                if "up" in action:
-                    brightness = 100
-                elif "down" in action:
-                    brightness = 20
-                else:
-                    parts = action.split("_")
-                    brightness = 50
-                    for part in parts:
-                        if part.isdigit():
-                            brightness = int(part)
-                            break
-                return await self._client.set_brightness(device, brightness)
-            elif action.startswith("color_"):
-                color_map = {
-                    "red": 16711680, "green": 65280, "blue": 255, "white": 16777215,
-                    "warm": 16753920, "cool": 11593983
-                }
-                color_name = action.replace("color_", "")
-                rgb_value = color_map.get(color_name, 16777215)
-                return await self._client.set_color_rgb(device, rgb_value)
-            elif action.startswith("temp_"):
-                if "up" in action:
-                    temp_range = device_info.get("temperature_range", (20, 100))
-                    temperature = min(temp_range[1], 90)
-                elif "down" in action:
-                    temp_range = device_info.get("temperature_range", (20, 100))
-                    temperature = max(temp_range[0], 40)
-                else:
-                    parts = action.split("_")
-                    temperature = 80
-                    for part in parts:
-                        if part.isdigit():
-                            temperature = int(part)
-                            break
-                return await self._client.set_temperature(device, temperature)
-            elif action.startswith("mode_"):
-                mode_name = action.replace("mode_", "").replace("_", " ").title()
-                work_modes = device_info.get("work_modes", [])
-                
-                for mode in work_modes:
-                    if mode.get("name", "").lower() == mode_name.lower():
-                        return await self._client.set_work_mode(device, mode.get("instance", ""), mode.get("value", 1))
-                
-                kettle_mode_map = {"diy": 1, "tea": 2, "coffee": 3, "boiling": 4}
-                mode_value = kettle_mode_map.get(mode_name.lower())
-                if mode_value:
-                    return await self._client.set_work_mode(device, "workMode", mode_value)
-                    
-                return False
-            elif action.startswith("scene_"):
-                scene_name = action.replace("scene_", "").replace("_", " ").title()
-                scenes = device_info.get("scenes", [])
-                for scene in scenes:
-                    if scene.get("name", "").lower() == scene_name.lower():
-                        return await self._client.set_scene(device, scene.get("instance", ""), scene.get("value", 1))
-                return False
-            else:
-                return False
-                
-        except Exception as e:
-            _LOG.error(f"❌ Error executing mapped action {action}: {e}")
+    async def _execute_mapped_action(self, device: GoveeDevice, action: str, device_info: Dict[str, Any], device_id: str = None) -> bool:
+        # Client and API errors propagate to the caller, which logs them with the device name
+        call = self._dispatch_cache.get((device_id, action), _MISSING) if device_id else _MISSING
+        if call is _MISSING:
+            call = self._bind_action(device, action, device_info, device_id)
+            if device_id:
+                _bounded_put(self._dispatch_cache, (device_id, action), call, self.ACTION_CACHE_SIZE)
+        if call is None:
             return False
+        return await call()
 
-    def _map_ui_action_to_govee_action(self, ui_action: str, device_info: Dict[str, Any]) -> Optional[str]:
-        if ui_action == "ON":
-            return "turn_on" if device_info.get("supports_power") else None
-        elif ui_action == "OFF":
-            return "turn_off" if device_info.get("supports_power") else None
-        elif ui_action == "TOGGLE":
-            return "toggle" if device_info.get("supports_power") else None
-        elif ui_action == "DREAMVIEW_ON":
-            return "dreamview_on" if device_info.get("supports_dreamview") else None
-        elif ui_action == "DREAMVIEW_OFF":
-            return "dreamview_off" if device_info.get("supports_dreamview") else None
-        elif ui_action == "GRADIENT_ON":
-            return "gradient_on" if device_info.get("supports_gradient") else None
-        elif ui_action == "GRADIENT_OFF":
-            return "gradient_off" if device_info.get("supports_gradient") else None
-        elif ui_action.startswith("MUSIC_"):
-            return ui_action.lower() if device_info.get("supports_music") else None
-        elif ui_action in ["SENSITIVITY_UP", "SENSITIVITY_DOWN"]:
-            return ui_action.lower() if device_info.get("supports_music") else None
-        elif ui_action.startswith("BRIGHTNESS_"):
-            if not device_info.get("supports_brightness"):
-                return None
-            
-            if ui_action == "BRIGHTNESS_UP":
-                return "brightness_up"
-            elif ui_action == "BRIGHTNESS_DOWN":
-                return "brightness_down"
-            elif ui_action in ["BRIGHTNESS_25", "BRIGHTNESS_50", "BRIGHTNESS_75", "BRIGHTNESS_100"]:
-                return ui_action.lower()
-        elif ui_action.startswith("COLOR_"):
-            if not device_info.get("supports_color"):
-                return None
-            return ui_action.lower()
-        elif ui_action.startswith("TEMP_"):
-            if not device_info.get("supports_temperature"):
-                return None
+    def _bind_action(self, device: GoveeDevice, action: str, device_info: Dict[str, Any], device_id: Optional[str]) -> Optional[Callable[[], Awaitable[bool]]]:
+        """Resolve an action for one device into a ready-to-await call, or None if it is unsupported."""
+        handler = _EXACT_ACTION_HANDLERS.get(action)
+        if handler is not None:
+            # Power and toggle read and update cached state, so they stay full handlers
+            return functools.partial(handler, self, device, action, device_info, device_id)
+        prefix, separator, _ = action.partition("_")
+        binder = _PREFIX_ACTION_BINDERS.get(prefix) if separator else None
+        if binder is None:
+            return None
+        return binder(self, device, action, device_info)
+
+    async def _action_turn_on(self, device: GoveeDevice, action: str, device_info: Dict[str, Any], device_id: Optional[str]) -> bool:
+        result = await self._client.turn_on(device)
+        if result and device_id:
+            self._device_states[device_id] = True
+        return result
+
+    async def _action_turn_off(self, device: GoveeDevice, action: str, device_info: Dict[str, Any], device_id: Optional[str]) -> bool:
+        result = await self._client.turn_off(device)
+        if result and device_id:
+            self._device_states[device_id] = False
+        return result
+
+    async def _action_toggle(self, device: GoveeDevice, action: str, device_info: Dict[str, Any], device_id: Optional[str]) -> bool:
+        if not device_id:
+            return await self._client.turn_on(device)
+        
+        current_state = self._device_states.get(device_id, False)
+        _LOG.debug("Toggle %s: cached=%s -> %s", device.device_name, 'ON' if current_state else 'OFF', 'OFF' if current_state else 'ON')
+        
+        if current_state:
+            return await self._action_turn_off(device, action, device_info, device_id)
+        return await self._action_turn_on(device, action, device_info, device_id)
+
+    async def _action_dreamview(self, device: GoveeDevice, action: str, device_info: Dict[str, Any], device_id: Optional[str]) -> bool:
+        return await self._client.set_dreamview(device, action == "dreamview_on")
+
+    async def _action_gradient(self, device: GoveeDevice, action: str, device_info: Dict[str, Any], device_id: Optional[str]) -> bool:
+        return await self._client.set_gradient(device, action == "gradient_on")
+
+    async def _action_sensitivity(self, device: GoveeDevice, action: str, device_info: Dict[str, Any], device_id: Optional[str]) -> bool:
+        return await self._client.set_music_mode(device, 1, 75 if action == "sensitivity_up" else 25)
+
+    def _bind_music(self, device: GoveeDevice, action: str, device_info: Dict[str, Any]) -> Optional[functools.partial]:
+        mode = _find_by_name(device_info, "music_modes", "music_modes_by_name", action[len("music_"):].replace("_", " "))
+        if mode is None:
+            return None
+        return functools.partial(self._client.set_music_mode, device, mode[1], 50)
+
+    def _bind_brightness(self, device: GoveeDevice, action: str, device_info: Dict[str, Any]) -> functools.partial:
+        if "up" in action:
+            brightness = 100
+        elif "down" in action:
+            brightness = 20
+        else:
+            brightness = _numeric_suffix(action, 50)
+        return functools.partial(self._client.set_brightness, device, brightness)
+
+    def _bind_color(self, device: GoveeDevice, action: str, device_info: Dict[str, Any]) -> functools.partial:
+        color_name = action.replace("color_", "")
+        rgb_value = _COLOR_MAP.get(color_name, 16777215)
+        return functools.partial(self._client.set_color_rgb, device, rgb_value)
+
+    def _bind_temperature(self, device: GoveeDevice, action: str, device_info: Dict[str, Any]) -> functools.partial:
+        if "up" in action:
+            temperature = device_info.get("temp_up_value")
+            if temperature is None:
+                # Configs written before setup stored the button targets
+                temperature = min((device_info.get("temperature_range") or _DEFAULT_TEMP_RANGE)[1], 90)
+        elif "down" in action:
+            temperature = device_info.get("temp_down_value")
+            if temperature is None:
+                temperature = max((device_info.get("temperature_range") or _DEFAULT_TEMP_RANGE)[0], 40)
+        else:
+            temperature = _numeric_suffix(action, 80)
+        return functools.partial(self._client.set_temperature, device, temperature)
+
+    def _bind_work_mode(self, device: GoveeDevice, action: str, device_info: Dict[str, Any]) -> Optional[functools.partial]:
+        mode_name = action[len("mode_"):].replace("_", " ")
+        mode = _find_by_name(device_info, "work_modes", "work_modes_by_name", mode_name)
+        if mode is not None:
+            instance, value = mode
+            return functools.partial(self._client.set_work_mode, device, instance, value)
+        
+        mode_value = _KETTLE_MODE_MAP.get(mode_name)
+        if mode_value:
+            return functools.partial(self._client.set_work_mode, device, "workMode", mode_value)
             
-            if ui_action == "TEMP_UP":
-                return "temp_up"
-            elif ui_action == "TEMP_DOWN":
-                return "temp_down"
-            else:
-                return ui_action.lower()
-        elif ui_action.startswith("MODE_"):
-            if not device_info.get("supports_work_mode"):
-                return None
-            return ui_action.lower()
-        elif ui_action.startswith("SCENE_"):
-            if not device_info.get("supports_scenes"):
+        return None
+
+    def _bind_scene(self, device: GoveeDevice, action: str, device_info: Dict[str, Any]) -> Optional[functools.partial]:
+        scene = _find_by_name(device_info, "scenes", "scenes_by_name", action[len("scene_"):].replace("_", " "))
+        if scene is None:
+            return None
+        instance, value = scene
+        return functools.partial(self._client.set_scene, device, instance, value)
+
+    def _map_ui_action_to_govee_action(self, ui_action: str, device_id: str) -> Optional[str]:
+        key = (ui_action, device_id)
+        cached = self._action_map_cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        
+        action = self._resolve_ui_action(ui_action, device_id)
+        _bounded_put(self._action_map_cache, key, action, self.ACTION_CACHE_SIZE)
+        return action
+
+    def _resolve_ui_action(self, ui_action: str, device_id: str) -> Optional[str]:
+        entry = _UI_ACTION_MAP.get(ui_action)
+        if entry is None:
+            token, separator, _ = ui_action.partition("_")
+            capability = _OPEN_UI_ACTION_FAMILIES.get(token) if separator else None
+            if capability is None:
                 return None
-            return ui_action.lower()
+            entry = (capability, ui_action.lower())
         
-        return None
\ No newline at end of file
+        capability, action = entry
+        return action if self._caps[device_id] & capability else None
+
+
+# Client action -> GoveeRemote handler, for actions with a fixed name
+_EXACT_ACTION_HANDLERS = {
+    "turn_on": GoveeRemote._action_turn_on,
+    "turn_off": GoveeRemote._action_turn_off,
+    "toggle": GoveeRemote._action_toggle,
+    "dreamview_on": GoveeRemote._action_dreamview,
+    "dreamview_off": GoveeRemote._action_dreamview,
+    "gradient_on": GoveeRemote._action_gradient,
+    "gradient_off": GoveeRemote._action_gradient,
+    "sensitivity_up": GoveeRemote._action_sensitivity,
+    "sensitivity_down": GoveeRemote._action_sensitivity,
+}
+
+# Leading token -> binder, for parameterized actions such as brightness_75 or scene_sunset
+_PREFIX_ACTION_BINDERS = {
+    "music": GoveeRemote._bind_music,
+    "brightness": GoveeRemote._bind_brightness,
+    "color": GoveeRemote._bind_color,
+    "temp": GoveeRemote._bind_temperature,
+    "mode": GoveeRemote._bind_work_mode,
+    "scene": GoveeRemote._bind_scene,
+}
@@ -6,7 +6,8 @@ Setup flow for Govee integration.
 """
 
 import logging
-from typing import Any, Dict, Callable, Coroutine
+import time
+from typing import Any, Dict, Callable, Coroutine, List, Tuple
 
 import ucapi.api_definitions as uc
 from uc_intg_govee.client import GoveeClient, GoveeAPIError
@@ -15,9 +16,30 @@ from uc_intg_govee.config import GoveeConfig
 _LOG = logging.getLogger(__name__)
 
 
+def _index_by_name(entries: list) -> Dict[str, Tuple[str, Any]]:
+    """Map each mode or scene's lower-cased name to its (instance, value); the first of duplicate names wins."""
+    index = {}
+    for entry in entries:
+        # Options without a name can't be addressed by a command, and may carry "name": None
+        name = (entry.get("name") or "").lower()
+        if not name:
+            continue
+        index.setdefault(name, (entry.get("instance", ""), entry.get("value", 1)))
+    return index
+
+
+def _capability_summaries(devices: list) -> List[Dict[str, Any]]:
+    """Return a private copy of each device's capabilities summary, in device order."""
+    # Copies: the summary is memoized on the device and callers mutate theirs
+    return [dict(device.get_all_capabilities_summary()) for device in devices]
+
+
 class GoveeSetup:
     """Setup handler for Govee integration."""
 
+    # An existing config that passed a connection test this recently is trusted without re-testing
+    CONNECTION_TEST_TTL = 300
+
     def __init__(self, config: GoveeConfig, client: GoveeClient, setup_complete_callback: Callable[[], Coroutine[Any, Any, None]]):
         self.config = config
         self.client = client
@@ -68,10 +90,18 @@ class GoveeSetup:
             if not self.config.api_key:
                 return False
             
-            self.client._api_key = self.config.api_key
-            self.client._headers["Govee-API-Key"] = self.config.api_key
+            self.client.set_api_key(self.config.api_key)
+            
+            # Wall-clock rather than monotonic: the timestamp outlives driver restarts
+            if 0 <= time.time() - self.config.last_test_ts < self.CONNECTION_TEST_TTL:
+                _LOG.debug("Existing configuration was tested recently, skipping connection test")
+                return True
             
-            return await self.client.test_connection()
+            if not await self.client.test_connection():
+                return False
+            
+            self.config.last_test_ts = time.time()
+            return True
         except Exception as e:
             _LOG.error(f"Error testing existing config: {e}")
             return False
@@ -80,8 +110,7 @@ class GoveeSetup:
         _LOG.info("Testing connection to Govee API")
 
         try:
-            self.client._api_key = api_key
-            self.client._headers["Govee-API-Key"] = api_key
+            self.client.set_api_key(api_key)
 
             if not await self.client.test_connection():
                 _LOG.error("Failed to connect to Govee API")
@@ -94,7 +123,7 @@ class GoveeSetup:
                 _LOG.warning("No devices found in user's Govee account")
                 self.config.api_key = api_key
                 self.config.devices = {}
-                self.config.save()
+                await self.config.save_async()
                 
                 await self._setup_complete_callback()
                 return uc.SetupComplete()
@@ -119,53 +148,48 @@ class GoveeSetup:
             device_count = len(devices)
             _LOG.info(f"Discovered {device_count} Govee devices")
 
+            summaries = _capability_summaries(devices)
+            
             discovered_devices = {}
-            for device in devices:
+            for device, capabilities_summary in zip(devices, summaries):
                 device_id = device.device_id
                 
-                capabilities_summary = device.get_all_capabilities_summary()
+                # Stored under "type" below; api_type and the rest are copied as-is
+                del capabilities_summary["device_type"]
+                
+                temperature_range = capabilities_summary["temperature_range"]
                 
                 discovered_devices[device_id] = {
                     "name": device.device_name,
                     "type": device.device_type,
-                    "api_type": device.api_type,
                     "sku": device.sku,
                     "capabilities": device.capabilities,
-                    "supports_power": capabilities_summary["supports_power"],
-                    "supports_brightness": capabilities_summary["supports_brightness"],
-                    "supports_color": capabilities_summary["supports_color"],
-                    "supports_color_temp": capabilities_summary["supports_color_temp"],
-                    "supports_scenes": capabilities_summary["supports_scenes"],
-                    "supports_music": capabilities_summary["supports_music"],
-                    "supports_temperature": capabilities_summary["supports_temperature"],
-                    "supports_work_mode": capabilities_summary["supports_work_mode"],
-                    "supports_timer": capabilities_summary["supports_timer"],
-                    "supports_humidity": capabilities_summary["supports_humidity"],
-                    "supports_fan_mode": capabilities_summary["supports_fan_mode"],
-                    "supports_gradient": capabilities_summary["supports_gradient"],
-                    "supports_dreamview": capabilities_summary["supports_dreamview"],
-                    "supports_segmented": capabilities_summary["supports_segmented"],
-                    "brightness_range": capabilities_summary["brightness_range"],
-                    "color_temp_range": capabilities_summary["color_temp_range"],
-                    "temperature_range": capabilities_summary["temperature_range"],
-                    "work_modes": capabilities_summary["work_modes"],
-                    "music_modes": capabilities_summary["music_modes"],
-                    "scenes": capabilities_summary["scenes"]
+                    **capabilities_summary,
+                    "music_modes_by_name": _index_by_name(capabilities_summary["music_modes"]),
+                    "work_modes_by_name": _index_by_name(capabilities_summary["work_modes"]),
+                    "scenes_by_name": _index_by_name(capabilities_summary["scenes"]),
+                    # Targets for the TEMP_UP / TEMP_DOWN buttons
+                    "temp_up_value": min(temperature_range[1], 90) if temperature_range else None,
+                    "temp_down_value": max(temperature_range[0], 40) if temperature_range else None
                 }
                 
-                _LOG.info(f"Device: {device.device_name} ({device.device_type}/{device.api_type}) - SKU: {device.sku}")
-                _LOG.debug(f"  Capabilities: Power={capabilities_summary['supports_power']}, "
-                          f"Brightness={capabilities_summary['supports_brightness']}, "
-                          f"Color={capabilities_summary['supports_color']}, "
-                          f"Temperature={capabilities_summary['supports_temperature']}, "
-                          f"WorkMode={capabilities_summary['supports_work_mode']}, "
-                          f"DreamView={capabilities_summary['supports_dreamview']}, "
-                          f"Gradient={capabilities_summary['supports_gradient']}, "
-                          f"Music={capabilities_summary['supports_music']}")
+                _LOG.info("Device: %s (%s/%s) - SKU: %s", device.device_name, device.device_type, device.api_type, device.sku)
+                if _LOG.isEnabledFor(logging.DEBUG):
+                    _LOG.debug("  Capabilities: Power=%s, Brightness=%s, Color=%s, Temperature=%s, "
+                               "WorkMode=%s, DreamView=%s, Gradient=%s, Music=%s",
+                               capabilities_summary['supports_power'],
+                               capabilities_summary['supports_brightness'],
+                               capabilities_summary['supports_color'],
+                               capabilities_summary['supports_temperature'],
+                               capabilities_summary['supports_work_mode'],
+                               capabilities_summary['supports_dreamview'],
+                               capabilities_summary['supports_gradient'],
+                               capabilities_summary['supports_music'])
 
             self.config.api_key = api_key
             self.config.devices = discovered_devices
-            self.config.save()
+            self.config.last_test_ts = time.time()
+            await self.config.save_async()
             
             _LOG.info(f"Saved {len(discovered_devices)} devices to configuration")
             _LOG.info("Successfully connected to Govee API and discovered devices")